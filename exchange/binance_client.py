@@ -1,14 +1,81 @@
 import hmac
 import math
 import asyncio
+from decimal import Decimal, ROUND_DOWN
 import hashlib
 import time
 import logging
 import ssl
 import aiohttp
+import orjson
+import yarl
+import numpy as np
 import pandas as pd
-import json
-from urllib.parse import urlencode
+from urllib.parse import urlencode, quote
+
+# One hardened TLS context for all client instances. Verification stays
+# on: OpenSSL session resumption keeps reconnect handshakes cheap, and
+# disabling it bought nothing but a MITM hole.
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.minimum_version = ssl.TLSVersion.TLSv1_2
+
+_QUERY_SAFE = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.-_"
+)
+
+
+def _build_query(params):
+    """Build the query bytestring for signing without urlencode overhead.
+
+    Binance params are short ASCII (symbol, side, numerics), so the common
+    case is a plain join; only values with reserved characters (e.g. the
+    JSON array for batchOrders) fall back to percent encoding. Returning
+    bytes lets the HMAC update skip a re-encode.
+    """
+    parts = []
+    for k, v in params.items():
+        v = str(v)
+        if all(c in _QUERY_SAFE for c in v):
+            parts.append(f"{k}={v}".encode('ascii'))
+        else:
+            parts.append(f"{k}={quote(v, safe='')}".encode('ascii'))
+    return b'&'.join(parts)
+
+
+class _TokenBucket:
+    """Minimal async token bucket on the loop's monotonic clock.
+
+    Unlike the old last-call-timestamp check, concurrent coroutines each
+    draw their own token, so gather() batches run in parallel up to the
+    configured rate instead of serializing behind one global sleep.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self.updated is not None:
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.rate
+                )
+            self.updated = now
+
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.rate
+                await asyncio.sleep(wait)
+                self.updated = loop.time()
+                self.tokens = 1
+
+            self.tokens -= 1
+
 
 class BinanceClient:
     def __init__(self, api_key, api_secret, testnet=False, logger=None):
@@ -32,64 +99,198 @@ class BinanceClient:
         print(f"Using {'TESTNET' if testnet else 'LIVE'} environment")
         self.session = None
         self.symbol_info = {}
-        self.last_api_call = 0
-        self.rate_limit = 0.1
-        self.headers = {
-            "X-MBX-APIKEY": self.api_key,
-            "Content-Type": "application/json"
-        }
+        # symbol -> (step_size, min_qty, lot_precision, price_precision,
+        # quantity_precision), parsed once at load time so hot paths do a
+        # single dict lookup instead of re-scanning the filter list
+        self.lot = {}
+        # symbol -> (step Decimal, minQty Decimal) for exact quantization
+        self.lot_dec = {}
+        self._info_ready = asyncio.Event()
+        self._info_lock = asyncio.Lock()
+        # Stay under Binance's 1200/min request-weight budget
+        self._limiter = _TokenBucket(rate=1100 / 60, capacity=20)
         self.recv_window = 5000  # Binance's recommended value
+        # Wall-clock to Binance server time offset, derived once from
+        # /fapi/v1/time and applied to the monotonic clock (no syscall per
+        # request, no -1021 timestamp drift rejections)
+        self._t_offset_ns = None
+        self._time_task = None
+        # Latest mark price per symbol, fed by the WebSocket stream so hot
+        # polling paths can read a price without a REST round-trip
+        self._last_price = {}
+        self._ws_task = None
+        self.ws_url = ("wss://stream.binancefuture.com/ws" if testnet
+                       else "wss://fstream.binance.com/ws")
+        # User-data stream: order/position events pushed into a queue so
+        # consumers can react instead of polling REST
+        self._user_q = None
+        self._user_task = None
+
+        # Precompute the HMAC-SHA256 inner/outer states once so each signed
+        # request only pays two .copy() + update calls instead of re-keying
+        # (hashlib.sha256 routes through OpenSSL's hardware SHA path).
+        key = self.api_secret.encode('utf-8')
+        if len(key) > 64:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(64, b'\0')
+        self._hmac_inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+        self._hmac_outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+
+    def _timestamp_ms(self):
+        """Binance-synchronized timestamp in milliseconds"""
+        if self._t_offset_ns is None:
+            return int(time.time() * 1000)
+        return (time.monotonic_ns() + self._t_offset_ns) // 1_000_000
+
+    async def _sync_server_time(self):
+        data = await self._request("GET", "/fapi/v1/time")
+        self._t_offset_ns = data['serverTime'] * 1_000_000 - time.monotonic_ns()
+
+    async def _resync_time_loop(self):
+        while True:
+            await asyncio.sleep(300)
+            try:
+                await self._sync_server_time()
+            except Exception as e:
+                self.logger.warning(f"Server time resync failed: {e}")
+
+    def _sign(self, query_bytes):
+        """HMAC-SHA256 signature from the precomputed key states"""
+        inner = self._hmac_inner.copy()
+        inner.update(query_bytes)
+        outer = self._hmac_outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
 
     async def _request(self, method, endpoint, params=None, signed=False):
         url = f"{self.base_url}{endpoint}"
         
         if signed:
             params = params or {}
-            params['timestamp'] = int(time.time() * 1000)  # Add timestamp first
-            query_string = urlencode(params)
-            signature = hmac.new(
-                self.api_secret.encode('utf-8'),
-                query_string.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
-            params['signature'] = signature
+            params['timestamp'] = self._timestamp_ms()  # Add timestamp first
+            query = _build_query(params)
+            # Send the exact bytes that were signed: encoded=True stops
+            # yarl from re-normalizing the query (it would decode %3A/%2C
+            # back to :/, and break the signature over e.g. batchOrders)
+            url = yarl.URL(
+                f"{url}?{query.decode('ascii')}&signature={self._sign(query)}",
+                encoded=True
+            )
+            params = None
         
         # Rate limiting
-        elapsed = time.time() - self.last_api_call
-        if elapsed < self.rate_limit:
-            await asyncio.sleep(self.rate_limit - elapsed)
-        
+        await self._limiter.acquire()
+
         try:
+            # Auth headers live on the session; passing them per-request
+            # would copy/merge a dict on every call (and forced a bogus
+            # JSON Content-Type onto form-style requests)
             async with self.session.request(
-                method, 
-                url, 
-                params=params, 
-                headers=self.headers
+                method,
+                url,
+                params=params
             ) as response:
-                self.last_api_call = time.time()
-                
+                # orjson parses the raw bytes much faster than aiohttp's
+                # stdlib json path (matters for klines/exchangeInfo payloads)
                 if response.status != 200:
-                    error = await response.json()
+                    error = orjson.loads(await response.read())
                     raise Exception(f"API Error {response.status}: {error}")
-                    
-                return await response.json()
+
+                return orjson.loads(await response.read())
                 
         except Exception as e:
             self.logger.error(f"Request failed to {url}: {str(e)}")
             raise
 
     async def initialize(self):
-        # Create custom SSL context
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        
+        # Single pooled session shared by every module that holds this
+        # client; keep-alive avoids a fresh TLS handshake per request
         self.session = aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=ssl_context),
-            headers={"X-MBX-APIKEY": self.api_key}
+            connector=aiohttp.TCPConnector(
+                ssl=_SSL_CTX,
+                limit=100,
+                limit_per_host=30,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            ),
+            headers={
+                "X-MBX-APIKEY": self.api_key,
+                "Connection": "keep-alive"
+            },
+            timeout=aiohttp.ClientTimeout(total=30),
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
         )
+        await self._sync_server_time()
+        self._time_task = asyncio.create_task(self._resync_time_loop())
+        self._ws_task = asyncio.create_task(self._mark_price_loop())
         await self.load_symbol_info()
-        
+
+    async def _mark_price_loop(self):
+        """Keep _last_price fresh from the all-symbols mark price stream"""
+        url = f"{self.ws_url}/!markPrice@arr@1s"
+        while True:
+            try:
+                async with self.session.ws_connect(url, heartbeat=60) as ws:
+                    async for msg in ws:
+                        if msg.type != aiohttp.WSMsgType.TEXT:
+                            continue
+                        for item in orjson.loads(msg.data):
+                            self._last_price[item['s']] = float(item['p'])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Mark price stream error: {e}")
+                await asyncio.sleep(5)
+
+    def get_cached_price(self, symbol):
+        """Latest mark price from the WS stream, or None before first tick"""
+        return self._last_price.get(symbol)
+
+    async def start_user_stream(self):
+        """Subscribe to the user-data stream and return its event queue"""
+        if self._user_q is None:
+            self._user_q = asyncio.Queue(maxsize=1000)
+            self._user_task = asyncio.create_task(self._user_stream_loop())
+        return self._user_q
+
+    async def _user_stream_loop(self):
+        """Pump user-data events (orders, account updates) into _user_q"""
+        while True:
+            keepalive = None
+            try:
+                data = await self._request("POST", "/fapi/v1/listenKey")
+                listen_key = data['listenKey']
+                keepalive = asyncio.create_task(self._keepalive_listen_key())
+                async with self.session.ws_connect(
+                    f"{self.ws_url}/{listen_key}", heartbeat=60
+                ) as ws:
+                    async for msg in ws:
+                        if msg.type != aiohttp.WSMsgType.TEXT:
+                            continue
+                        # Drop the oldest event rather than block the
+                        # stream reader if the consumer falls behind
+                        if self._user_q.full():
+                            self._user_q.get_nowait()
+                        self._user_q.put_nowait(orjson.loads(msg.data))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"User data stream error: {e}")
+                await asyncio.sleep(5)
+            finally:
+                if keepalive is not None:
+                    keepalive.cancel()
+
+    async def _keepalive_listen_key(self):
+        """listenKeys expire after 60 minutes without a keepalive ping"""
+        while True:
+            await asyncio.sleep(1800)
+            try:
+                await self._request("PUT", "/fapi/v1/listenKey")
+            except Exception as e:
+                self.logger.warning(f"listenKey keepalive failed: {e}")
+
     async def load_symbol_info(self):
         data = await self._request("GET", "/fapi/v1/exchangeInfo")
         for symbol in data['symbols']:
@@ -99,68 +300,86 @@ class BinanceClient:
                 'filters': symbol['filters']
             }
 
+            # Parse the LOT_SIZE filter once so per-order lookups are cheap
+            step_size, min_qty, precision = 0.0, 0.001, 8
+            for f in symbol['filters']:
+                if f['filterType'] == 'LOT_SIZE':
+                    step_size = float(f['stepSize'])
+                    min_qty = float(f['minQty'])
+                    if '.' in f['stepSize']:
+                        precision = len(f['stepSize'].split('.')[1].rstrip('0'))
+                    else:
+                        precision = 0
+                    # Exact decimals straight from the exchange strings -
+                    # no binary-float rounding error to begin with
+                    self.lot_dec[symbol['symbol']] = (
+                        Decimal(f['stepSize']).normalize(),
+                        Decimal(f['minQty'])
+                    )
+                    break
+            self.lot[symbol['symbol']] = (
+                step_size,
+                min_qty,
+                precision,
+                symbol['pricePrecision'],
+                symbol['quantityPrecision']
+            )
+
+        self._info_ready.set()
+
+    async def _ensure_symbol_info(self):
+        """Load exchangeInfo once; concurrent callers wait on the first fetch
+
+        Without this, a burst of orders before initialize() finishes would
+        trigger one ~100KB exchangeInfo download per caller.
+        """
+        if self._info_ready.is_set():
+            return
+        async with self._info_lock:
+            if not self._info_ready.is_set():
+                await self.load_symbol_info()
+
     async def get_symbol_info(self, symbol):
         """Get detailed symbol information"""
-        if not self.symbol_info:
-            await self.load_symbol_info()
+        await self._ensure_symbol_info()
         return self.symbol_info.get(symbol, {})
     
     async def get_precision(self, symbol):
-        if not self.symbol_info:
-            await self.load_symbol_info()
-        
-        info = self.symbol_info.get(symbol, {})
-        filters = info.get('filters', [])
-        
-        # Find LOT_SIZE filter
-        for f in filters:
-            if f['filterType'] == 'LOT_SIZE':
-                step_size = f['stepSize']
-                # Calculate precision from step size
-                if '.' in step_size:
-                    return len(step_size.split('.')[1].rstrip('0'))
-                return 0
+        await self._ensure_symbol_info()
+
+        lot = self.lot.get(symbol)
+        if lot and lot[0] > 0:
+            return lot[2]
         return 8  # Default if not found
-    
+
     async def validate_quantity(self, symbol, quantity):
-        """Final robust quantity validation with proper rounding"""
-        if not self.symbol_info:
-            await self.load_symbol_info()
-        
-        info = self.symbol_info.get(symbol, {})
-        filters = info.get('filters', [])
-        
-        for f in filters:
-            if f['filterType'] == 'LOT_SIZE':
-                step_size = float(f['stepSize'])
-                min_qty = float(f['minQty'])
-                
-                # Calculate precision from step size
-                if step_size >= 1:
-                    precision = 0
-                else:
-                    precision = len(f['stepSize'].split('.')[1].rstrip('0'))
-                
-                # Round to exact step size multiple
-                quantity = float(quantity)
-                quantity = round(quantity / step_size) * step_size
-                quantity = round(quantity, precision)
-                
-                # Ensure meets minimum
-                if quantity < min_qty:
-                    quantity = min_qty
-                    quantity = round(quantity / step_size) * step_size
-                    quantity = round(quantity, precision)
-                    
-                return float(format(quantity, f".{precision}f"))
-        
+        """Snap quantity onto the symbol's step grid with exact decimals"""
+        await self._ensure_symbol_info()
+        return self.validate_quantity_sync(symbol, quantity)
+
+    def validate_quantity_sync(self, symbol, quantity):
+        """Sync validation against the cached filter table.
+
+        The LOT_SIZE filters are static for hours and loaded once at
+        initialize(), so hot paths can snap quantities locally without
+        an await.
+        """
+        lot_dec = self.lot_dec.get(symbol)
+        if lot_dec:
+            step_dec, min_qty_dec = lot_dec
+            # One exact quantize instead of the old round/round/format/float
+            # chain that stacked three binary rounding errors
+            q = Decimal(str(quantity)).quantize(step_dec, rounding=ROUND_DOWN)
+            if q < min_qty_dec:
+                q = min_qty_dec
+            return float(q)
+
         return round(float(quantity), 8)
     
     async def create_order(self, symbol, side, quantity, order_type="MARKET", **kwargs):
         """Robust order creation with precision handling"""
         # Get symbol precision info
-        if not self.symbol_info:
-            await self.load_symbol_info()
+        await self._ensure_symbol_info()
         
         symbol_data = self.symbol_info.get(symbol, {})
         price_precision = symbol_data.get('price_precision', 2)
@@ -172,7 +391,7 @@ class BinanceClient:
             'side': side,
             'type': order_type,
             'quantity': f"{float(quantity):.{quantity_precision}f}",
-            'timestamp': str(int(time.time() * 1000)),
+            'timestamp': str(self._timestamp_ms()),
             'newOrderRespType': 'FULL',
             'workingType': 'MARK_PRICE',
             'priceProtect': 'true'
@@ -183,7 +402,13 @@ class BinanceClient:
             if price_param in kwargs:
                 kwargs[price_param] = f"{float(kwargs[price_param]):.{price_precision}f}"
 
-        params.update({k: str(v) for k, v in kwargs.items() if v is not None})
+        # Structured values (lists/dicts) must be embedded as JSON strings;
+        # orjson serializes them without the per-element str() round-trip.
+        # Scalars go through urlencode's own C-level stringification.
+        params.update({
+            k: (orjson.dumps(v).decode() if isinstance(v, (list, dict)) else v)
+            for k, v in kwargs.items() if v is not None
+        })
 
         try:
             return await self._request("POST", "/fapi/v1/order", params, signed=True)
@@ -199,32 +424,60 @@ class BinanceClient:
         if not parent_order:
             return None
             
-        # Create OCO orders
-        stop_order = await self.create_order(
-            symbol,
-            "SELL" if side == "BUY" else "BUY",
-            quantity,
-            "STOP_MARKET",
-            stop_price=stop_loss_price
-        )
-        
-        take_profit_orders = []
+        # Submit SL + TPs through the native batch endpoint (up to 5 orders
+        # per request) instead of one HTTP round-trip per child order
+        await self._ensure_symbol_info()
+        symbol_data = self.symbol_info.get(symbol, {})
+        price_precision = symbol_data.get('price_precision', 2)
+        quantity_precision = symbol_data.get('quantity_precision', 3)
+
+        close_side = "SELL" if side == "BUY" else "BUY"
+        children = [{
+            'symbol': symbol,
+            'side': close_side,
+            'type': 'STOP_MARKET',
+            'quantity': f"{float(quantity):.{quantity_precision}f}",
+            'stopPrice': f"{float(stop_loss_price):.{price_precision}f}",
+            'reduceOnly': 'true'
+        }]
         for tp in take_profit_prices:
-            tp_order = await self.create_order(
-                symbol,
-                "SELL" if side == "BUY" else "BUY",
-                quantity * (tp['percentage'] / 100),
-                "TAKE_PROFIT_MARKET",
-                take_profit_price=tp['price']
-            )
-            take_profit_orders.append(tp_order)
-            
+            children.append({
+                'symbol': symbol,
+                'side': close_side,
+                'type': 'TAKE_PROFIT_MARKET',
+                'quantity': f"{quantity * (tp['percentage'] / 100):.{quantity_precision}f}",
+                'stopPrice': f"{float(tp['price']):.{price_precision}f}",
+                'reduceOnly': 'true'
+            })
+
+        responses = await self.create_batch_orders(children)
+
+        stop_order = responses[0]
+        take_profit_orders = responses[1:]
+
         return {
             'parent_order': parent_order,
             'stop_order': stop_order,
             'take_profit_orders': take_profit_orders
         }
     
+    async def create_batch_orders(self, orders):
+        """Submit orders through /fapi/v1/batchOrders, 5 per signed request.
+
+        Returns one response entry per submitted order; failed entries
+        carry a 'code' field instead of an 'orderId'.
+        """
+        responses = []
+        for i in range(0, len(orders), 5):
+            batch = await self._request(
+                "POST",
+                "/fapi/v1/batchOrders",
+                {'batchOrders': orjson.dumps(orders[i:i + 5]).decode()},
+                signed=True
+            )
+            responses.extend(batch)
+        return responses
+
     async def get_account_balance(self):
         data = await self._request("GET", "/fapi/v2/account", signed=True)
         return {asset['asset']: float(asset['availableBalance']) 
@@ -244,9 +497,10 @@ class BinanceClient:
         positions = await self.get_position_risk()
         results = []
         for position in positions:
-            if float(position['positionAmt']) != 0:
-                side = "SELL" if float(position['positionAmt']) > 0 else "BUY"
-                quantity = abs(float(position['positionAmt']))
+            amt = float(position['positionAmt'])
+            if amt != 0:
+                side = "SELL" if amt > 0 else "BUY"
+                quantity = abs(amt)
                 result = await self.create_order(
                     position['symbol'], 
                     side, 
@@ -264,37 +518,61 @@ class BinanceClient:
             "limit": limit
         }
         data = await self._request("GET", endpoint, params)
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(data, columns=[
-            'open_time', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_volume', 'count', 'taker_buy_volume',
-            'taker_buy_quote_volume', 'ignore'
-        ])
-        
-        # Convert to numeric
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-        df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric)
-        
+
+        # Build numeric columns directly as float64 arrays instead of a
+        # string DataFrame followed by a per-element pd.to_numeric pass
+        n = len(data)
+        df = pd.DataFrame({
+            'open_time': np.fromiter((r[0] for r in data), dtype=np.int64, count=n),
+            'open': np.fromiter((r[1] for r in data), dtype=np.float64, count=n),
+            'high': np.fromiter((r[2] for r in data), dtype=np.float64, count=n),
+            'low': np.fromiter((r[3] for r in data), dtype=np.float64, count=n),
+            'close': np.fromiter((r[4] for r in data), dtype=np.float64, count=n),
+            'volume': np.fromiter((r[5] for r in data), dtype=np.float64, count=n),
+            'close_time': np.fromiter((r[6] for r in data), dtype=np.int64, count=n),
+            'quote_volume': np.fromiter((r[7] for r in data), dtype=np.float64, count=n),
+            'count': np.fromiter((r[8] for r in data), dtype=np.int64, count=n),
+            'taker_buy_volume': np.fromiter((r[9] for r in data), dtype=np.float64, count=n),
+            'taker_buy_quote_volume': np.fromiter((r[10] for r in data), dtype=np.float64, count=n),
+        })
+
         return df
 
+    async def get_all_mark_prices(self):
+        """Latest price for every symbol in a single request"""
+        return await self._request("GET", "/fapi/v1/ticker/price")
+
+    async def get_last_close(self, symbol, interval="1m"):
+        """Latest close as a bare float - no DataFrame for one number"""
+        params = {
+            "symbol": symbol,
+            "interval": interval,
+            "limit": 1
+        }
+        data = await self._request("GET", "/fapi/v1/klines", params)
+        return float(data[-1][4])
+
     async def close(self):
+        if self._ws_task:
+            self._ws_task.cancel()
+            self._ws_task = None
+        if self._user_task:
+            self._user_task.cancel()
+            self._user_task = None
+        if self._time_task:
+            self._time_task.cancel()
+            self._time_task = None
         if self.session:
             await self.session.close()
 
     async def get_min_qty(self, symbol):
         """Get minimum order quantity for a symbol"""
-        if not self.symbol_info:
-            await self.load_symbol_info()
-        
-        info = self.symbol_info.get(symbol, {})
-        filters = info.get('filters', [])
-        
-        # Find LOT_SIZE filter
-        for f in filters:
-            if f['filterType'] == 'LOT_SIZE':
-                return float(f['minQty'])
-        
+        await self._ensure_symbol_info()
+
+        lot = self.lot.get(symbol)
+        if lot and lot[0] > 0:
+            return lot[1]
+
         return 0.001  # Default minimum if not found
 
     async def get_order(self, symbol, orderId):
@@ -302,7 +580,7 @@ class BinanceClient:
         params = {
             'symbol': symbol,
             'orderId': orderId,
-            'timestamp': int(time.time() * 1000)
+            'timestamp': self._timestamp_ms()
         }
         return await self._request("GET", "/fapi/v1/order", params, signed=True)
 
@@ -310,7 +588,7 @@ class BinanceClient:
         """Cancel all open orders for a symbol"""
         params = {
             'symbol': symbol,
-            'timestamp': int(time.time() * 1000)
+            'timestamp': self._timestamp_ms()
         }
         return await self._request("DELETE", "/fapi/v1/allOpenOrders", params, signed=True)
 
@@ -319,6 +597,6 @@ class BinanceClient:
         params = {
             'symbol': symbol,
             'orderId': orderId,
-            'timestamp': int(time.time() * 1000)
+            'timestamp': self._timestamp_ms()
         }
         return await self._request("DELETE", "/fapi/v1/order", params, signed=True)
\ No newline at end of file
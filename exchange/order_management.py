@@ -29,40 +29,53 @@ class OrderManagement:
             # Brief delay for exchange to process
             await asyncio.sleep(1)
             
-            # Place stop loss
-            sl_order = await self.client.create_order(
+            # Place stop loss and take profits concurrently - each await is
+            # a full network round-trip, so fire them all in one batch
+            close_side = "SELL" if side == "BUY" else "BUY"
+            sl_task = self.client.create_order(
                 symbol=symbol,
-                side="SELL" if side == "BUY" else "BUY",
+                side=close_side,
                 quantity=quantity,
                 order_type="STOP_MARKET",
                 stop_price=stop_loss,
                 reduce_only=True
             )
-            self.logger.info(f"Stop loss placed: {sl_order}")
-            
-            # Place take profits
-            tp_orders = []
-            for tp in take_profits:
-                tp_order = await self.client.create_order(
+            tp_tasks = [
+                self.client.create_order(
                     symbol=symbol,
-                    side="SELL" if side == "BUY" else "BUY",
+                    side=close_side,
                     quantity=tp['quantity'],
                     order_type="TAKE_PROFIT_MARKET",
                     stop_price=tp['price'],
                     reduce_only=True
                 )
-                tp_orders.append(tp_order)
-                self.logger.info(f"Take profit placed: {tp_order}")
-            
-            # Verify orders in exchange
-            open_orders = await self.client._request(
-                "GET",
-                "/fapi/v1/openOrders",
-                {'symbol': symbol, 'timestamp': int(time.time() * 1000)},
-                signed=True
+                for tp in take_profits
+            ]
+            sl_order, *tp_orders = await asyncio.gather(
+                sl_task, *tp_tasks, return_exceptions=True
             )
-            self.logger.info(f"Open orders on exchange: {open_orders}")
-            
+
+            failures = [r for r in [sl_order] + tp_orders if isinstance(r, Exception)]
+            if failures:
+                raise Exception(f"SL/TP placement failed: {failures[0]}")
+
+            self.logger.info(f"Stop loss placed: {sl_order}")
+            for tp_order in tp_orders:
+                self.logger.info(f"Take profit placed: {tp_order}")
+
+            # The POST responses are the verification; hit openOrders only
+            # if any reply came back without an orderId
+            if not all(isinstance(o, dict) and o.get('orderId')
+                       for o in [sl_order] + tp_orders):
+                open_orders = await self.client._request(
+                    "GET",
+                    "/fapi/v1/openOrders",
+                    {'symbol': symbol},
+                    signed=True
+                )
+                if len(open_orders) < len(take_profits) + 1:
+                    raise Exception("Not all SL/TP orders were placed")
+
             return main_order
             
         except Exception as e:
@@ -82,41 +95,44 @@ class OrderManagement:
     async def update_trailing_stop(self, symbol: str, position: Dict):
         """Update trailing stop based on current price"""
         try:
-            klines = await self.client.get_klines(symbol, limit=1)
-            current_price = float(klines['close'].iloc[-1])
+            # Prefer the streamed mark price; fall back to REST only before
+            # the first WS tick arrives
+            current_price = self.client.get_cached_price(symbol)
+            if current_price is None:
+                current_price = await self.client.get_last_close(symbol)
             
-            if position['side'] == 'BUY':
+            if position.side == 'BUY':
                 new_stop = current_price * (1 - self.config['strategy']['trailing_stop_distance'])
-                if new_stop > position['stop_loss']:
+                if new_stop > position.stop_loss:
                     # Cancel old SL
                     await self.cancel_order(symbol, 'stop_loss')
                     # Place new SL
                     sl_order = await self.client.create_order(
                         symbol=symbol,
                         side="SELL",
-                        quantity=position['quantity'],
+                        quantity=position.quantity,
                         order_type="STOP_MARKET",
                         stop_price=new_stop,
                         reduce_only=True
                     )
-                    position['stop_loss'] = new_stop
+                    position.stop_loss = new_stop
                     self.active_orders[symbol]['stop_loss'] = sl_order
                     
             else:  # SELL position
                 new_stop = current_price * (1 + self.config['strategy']['trailing_stop_distance'])
-                if new_stop < position['stop_loss']:
+                if new_stop < position.stop_loss:
                     # Cancel old SL
                     await self.cancel_order(symbol, 'stop_loss')
                     # Place new SL
                     sl_order = await self.client.create_order(
                         symbol=symbol,
                         side="BUY",
-                        quantity=position['quantity'],
+                        quantity=position.quantity,
                         order_type="STOP_MARKET",
                         stop_price=new_stop,
                         reduce_only=True
                     )
-                    position['stop_loss'] = new_stop
+                    position.stop_loss = new_stop
                     self.active_orders[symbol]['stop_loss'] = sl_order
                     
         except Exception as e:
@@ -1,6 +1,6 @@
 import asyncio
+import time
 from exchange.position_tracker import PositionTracker
-from datetime import datetime
 import numpy as np
 import logging
 
@@ -12,6 +12,7 @@ class OrderManager:
         self.notifier = notifier
         self.active_orders = {}
         self.position_tracker = PositionTracker(config, logger)
+        self._precision_cache = {}
 
     async def place_order(self, signal):
         """Updated order placement with better error recovery"""
@@ -35,7 +36,7 @@ class OrderManager:
             # 4. Get fill price with fallback
             avg_price = await self._calculate_avg_fill_price(order)
             if not avg_price:
-                avg_price = float((await self.client.get_klines(symbol, "1m", limit=1))['close'].iloc[-1])
+                avg_price = await self.client.get_last_close(symbol)
 
             # 5. Place SL/TP with flexible pricing
             await self._place_sl_tp_orders(
@@ -63,16 +64,17 @@ class OrderManager:
     async def _check_existing_position(self, symbol):
         """Close any existing position for this symbol"""
         positions = await self.client.get_position_risk()
-        existing = next((p for p in positions 
-                       if p['symbol'] == symbol and float(p['positionAmt']) != 0), None)
-        
-        if existing:
+        pos_by_sym = {p['symbol']: p for p in positions}
+        existing = pos_by_sym.get(symbol)
+        amt = float(existing['positionAmt']) if existing else 0.0
+
+        if amt != 0:
             self.logger.warning(f"Closing existing {symbol} position")
-            side = "SELL" if float(existing['positionAmt']) > 0 else "BUY"
+            side = "SELL" if amt > 0 else "BUY"
             await self.client.create_order(
                 symbol=symbol,
                 side=side,
-                quantity=str(abs(float(existing['positionAmt']))),
+                quantity=str(abs(amt)),
                 order_type="MARKET",
                 reduceOnly=True
             )
@@ -110,50 +112,6 @@ class OrderManager:
                     raise Exception(f"Order failed after retries: {str(e)}")
                 await asyncio.sleep(1)
 
-    def _calculate_avg_fill_price(self, order):
-        """Calculate average fill price from order response"""
-        fills = order.get('fills', [])
-        if not fills:
-            return None
-            
-        total_qty = sum(float(f['qty']) for f in fills)
-        return sum(float(f['price'])*float(f['qty']) for f in fills) / total_qty
-
-    async def _place_sl_tp_orders(self, symbol, side, quantity, entry_price, sl_price, take_profits):
-        """Place SL/TP orders with verification"""
-        # Place Stop Loss
-        await self.client.create_order(
-            symbol=symbol,
-            side="SELL" if side == "BUY" else "BUY",
-            quantity=str(quantity),
-            order_type="STOP_MARKET",
-            stopPrice=str(sl_price),
-            reduceOnly="true"
-        )
-        
-        # Place Take Profits
-        for tp in take_profits:
-            await self.client.create_order(
-                symbol=symbol,
-                side="SELL" if side == "BUY" else "BUY",
-                quantity=str(quantity * (tp['percentage'] / 100)),
-                order_type="TAKE_PROFIT_MARKET",
-                stopPrice=str(tp['price']),
-                reduceOnly="true"
-            )
-        
-        # Verify orders were placed
-        await asyncio.sleep(1)
-        open_orders = await self.client._request(
-            "GET",
-            "/fapi/v1/openOrders",
-            {'symbol': symbol},
-            signed=True
-        )
-        
-        if len(open_orders) < len(take_profits) + 1:
-            raise Exception("Not all SL/TP orders were placed")
-
     async def _record_position(self, signal, order, avg_price):
         """Record position in tracker"""
         position = {
@@ -161,7 +119,7 @@ class OrderManager:
             'side': signal["signal"],
             'quantity': float(order['executedQty']),
             'entry_price': avg_price,
-            'entry_time': datetime.utcnow(),
+            'entry_time_ns': time.time_ns(),
             'stop_loss': float(signal["stop_loss"]),
             'take_profits': signal["take_profits"]
         }
@@ -172,14 +130,18 @@ class OrderManager:
         if not self.notifier:
             return
             
-        message = (
-            f"🚀 {signal['signal']} {signal['symbol']}\n"
-            f"Entry: {fill_price:.2f}\n"
-            f"Size: {signal['size']:.4f}\n"
-            f"SL: {signal['stop_loss']:.2f}\n"
-            f"TPs: {', '.join(f"{tp['price']:.2f} ({tp['percentage']}%)" for tp in signal['take_profits'])}"
-        )
-        await self.notifier.send_message(message)
+        tp_parts = [
+            f"{tp['price']:.2f} ({tp['percentage']}%)"
+            for tp in signal['take_profits']
+        ]
+        lines = [
+            f"🚀 {signal['signal']} {signal['symbol']}",
+            f"Entry: {fill_price:.2f}",
+            f"Size: {signal['size']:.4f}",
+            f"SL: {signal['stop_loss']:.2f}",
+            "TPs: " + ", ".join(tp_parts)
+        ]
+        await self.notifier.send_message("\n".join(lines))
 
     async def _handle_failure(self, symbol, error):
         """Handle order failure"""
@@ -190,15 +152,15 @@ class OrderManager:
             
             # Close any partial position
             positions = await self.client.get_position_risk()
-            pos = next((p for p in positions 
-                       if p['symbol'] == symbol and float(p['positionAmt']) != 0), None)
-            
-            if pos:
-                side = "SELL" if float(pos['positionAmt']) > 0 else "BUY"
+            pos = {p['symbol']: p for p in positions}.get(symbol)
+            amt = float(pos['positionAmt']) if pos else 0.0
+
+            if amt != 0:
+                side = "SELL" if amt > 0 else "BUY"
                 await self.client.create_order(
                     symbol=symbol,
                     side=side,
-                    quantity=str(abs(float(pos['positionAmt']))),
+                    quantity=str(abs(amt)),
                     order_type="MARKET",
                     reduceOnly=True
                 )
@@ -215,49 +177,52 @@ class OrderManager:
         """Close all open positions safely"""
         try:
             positions = await self.client.get_position_risk()
-            results = []
-            
-            for position in positions:
-                pos_amount = float(position['positionAmt'])
-                if pos_amount == 0:
-                    continue
-                    
-                symbol = position['symbol']
-                try:
-                    side = "SELL" if pos_amount > 0 else "BUY"
-                    quantity = abs(pos_amount)
-                    
-                    # Close position
-                    result = await self.client.create_order(
-                        symbol=symbol,
-                        side=side,
-                        quantity=quantity,
-                        order_type="MARKET",
-                        reduceOnly=True
-                    )
-                    results.append(result)
-                    
-                    # Cancel all orders for this symbol
-                    await self.client.cancel_all_orders(symbol)
-                    
-                    # Update position tracker
-                    if self.position_tracker.get_position(symbol):
-                        self.position_tracker.close_position(
-                            symbol,
-                            exit_price=float(position['markPrice']),
-                            exit_reason='shutdown',
-                            pnl=float(position['unrealizedProfit'])
-                        )
-                        
-                except Exception as e:
-                    self.logger.error(f"Error closing {symbol}: {str(e)}")
-                    continue
-                    
-            return results
+            open_positions = [p for p in positions if float(p['positionAmt']) != 0]
+
+            # Each symbol's close+cancel is independent - run them all at once
+            results = await asyncio.gather(*[
+                self._close_exchange_position(position)
+                for position in open_positions
+            ])
+            return [r for r in results if r is not None]
         except Exception as e:
             self.logger.error(f"Error closing all positions: {str(e)}")
             raise
 
+    async def _close_exchange_position(self, position):
+        """Close one exchange position and clean up its orders/tracking"""
+        symbol = position['symbol']
+        pos_amount = float(position['positionAmt'])
+        try:
+            side = "SELL" if pos_amount > 0 else "BUY"
+            quantity = abs(pos_amount)
+
+            # Close position
+            result = await self.client.create_order(
+                symbol=symbol,
+                side=side,
+                quantity=quantity,
+                order_type="MARKET",
+                reduceOnly=True
+            )
+
+            # Cancel all orders for this symbol
+            await self.client.cancel_all_orders(symbol)
+
+            # Update position tracker
+            if self.position_tracker.get_position(symbol):
+                self.position_tracker.close_position(
+                    symbol,
+                    exit_price=float(position['markPrice']),
+                    exit_reason='shutdown',
+                    pnl=float(position['unrealizedProfit'])
+                )
+
+            return result
+        except Exception as e:
+            self.logger.error(f"Error closing {symbol}: {str(e)}")
+            return None
+
     async def _calculate_avg_fill_price(self, order):
         """More robust fill price calculation"""
         try:
@@ -273,7 +238,7 @@ class OrderManager:
             
             # Final fallback to entry price from position (requires await)
             positions = await self.client.get_position_risk()
-            pos = next((p for p in positions if p['symbol'] == order['symbol']), None)
+            pos = {p['symbol']: p for p in positions}.get(order['symbol'])
             if pos and float(pos['entryPrice']) > 0:
                 return float(pos['entryPrice'])
             
@@ -288,41 +253,27 @@ class OrderManager:
             # Get current market data
             klines = await self.client.get_klines(symbol, "1m", limit=1)
             current_price = float(klines['close'].iloc[-1])
-            price_precision = await self.client.get_precision(symbol)
+            price_precision = await self._get_precision(symbol)
             
-            # Calculate minimum price differences
+            # Minimum price distances: 0.15% for SL, 0.2% for TP
+            min_sl_diff = current_price * 0.0015
+            min_tp_diff = current_price * 0.002
+
+            # Hoist the direction-dependent pieces once instead of
+            # recomputing them inside every TP iteration
             if side == "BUY":
-                # For long positions
-                min_sl_diff = max(current_price * 0.0015, current_price * 0.0005)  # 0.15% min, 0.05% absolute
-                min_tp_diff = max(current_price * 0.002, current_price * 0.0005)    # 0.2% min, 0.05% absolute
-                
-                # Adjust SL price
                 sl_price = max(sl_price, current_price - min_sl_diff)
-                
-                # Adjust TP prices
-                adjusted_tps = []
-                for tp in take_profits:
-                    tp_price = max(tp['price'], current_price + min_tp_diff)
-                    adjusted_tps.append({
-                        'price': round(tp_price, price_precision),
-                        'percentage': tp['percentage']
-                    })
+                tp_limit = current_price + min_tp_diff
+                clamp = max
             else:
-                # For short positions
-                min_sl_diff = max(current_price * 0.0015, current_price * 0.0005)  # 0.15% min, 0.05% absolute
-                min_tp_diff = max(current_price * 0.002, current_price * 0.0005)    # 0.2% min, 0.05% absolute
-                
-                # Adjust SL price
                 sl_price = min(sl_price, current_price + min_sl_diff)
-                
-                # Adjust TP prices
-                adjusted_tps = []
-                for tp in take_profits:
-                    tp_price = min(tp['price'], current_price - min_tp_diff)
-                    adjusted_tps.append({
-                        'price': round(tp_price, price_precision),
-                        'percentage': tp['percentage']
-                    })
+                tp_limit = current_price - min_tp_diff
+                clamp = min
+
+            adjusted_tps = [{
+                'price': round(clamp(tp['price'], tp_limit), price_precision),
+                'percentage': tp['percentage']
+            } for tp in take_profits]
 
             # Place orders with retries
             await self._place_orders_with_retry(
@@ -341,66 +292,89 @@ class OrderManager:
             raise
 
     async def _place_orders_with_retry(self, symbol, side, quantity, sl_price, take_profits, price_precision, max_retries=3):
-        """Place orders with retry mechanism"""
+        """Place SL + all TPs in one batchOrders request, retrying only failures"""
+        opp_side = "SELL" if side == "BUY" else "BUY"
+        pending = [{
+            'symbol': symbol,
+            'side': opp_side,
+            'type': 'STOP_MARKET',
+            'quantity': str(round(quantity, price_precision)),
+            'stopPrice': str(sl_price),
+            'reduceOnly': 'true'
+        }] + [{
+            'symbol': symbol,
+            'side': opp_side,
+            'type': 'TAKE_PROFIT_MARKET',
+            'quantity': str(round(quantity * (tp['percentage'] / 100), price_precision)),
+            'stopPrice': str(tp['price']),
+            'reduceOnly': 'true'
+        } for tp in take_profits]
+
         for attempt in range(max_retries):
+            # One signed request instead of an HTTP round-trip per order
             try:
-                # Place Stop Loss
-                await self.client.create_order(
-                    symbol=symbol,
-                    side="SELL" if side == "BUY" else "BUY",
-                    quantity=round(quantity, price_precision),
-                    order_type="STOP_MARKET",
-                    stopPrice=str(sl_price),
-                    reduceOnly="true"
-                )
-                
-                # Place Take Profits
-                for tp in take_profits:
-                    await self.client.create_order(
-                        symbol=symbol,
-                        side="SELL" if side == "BUY" else "BUY",
-                        quantity=round(quantity * (tp['percentage'] / 100), price_precision),
-                        order_type="TAKE_PROFIT_MARKET",
-                        stopPrice=str(tp['price']),
-                        reduceOnly="true"
-                    )
-                
-                return True
-                
+                responses = await self.client.create_batch_orders(pending)
             except Exception as e:
+                # Transport failure means none of the pending orders went
+                # through - back off and resend the same batch rather than
+                # leaving the position unprotected on a transient error
                 if attempt == max_retries - 1:
                     raise
+                self.logger.warning(
+                    "SL/TP batch attempt %d failed for %s: %s",
+                    attempt + 1, symbol, e
+                )
                 await asyncio.sleep(1)
-                # Slightly adjust prices before retry
-                adjustment_factor = 1.001 if side == "BUY" else 0.999
-                sl_price = round(sl_price * adjustment_factor, price_precision)
-                take_profits = [{
-                    'price': round(tp['price'] * adjustment_factor, price_precision),
-                    'percentage': tp['percentage']
-                } for tp in take_profits]
+                continue
+
+            failed = [
+                (order, resp) for order, resp in zip(pending, responses)
+                if isinstance(resp, dict) and 'orderId' not in resp
+            ]
+            if not failed:
+                return True
+
+            if attempt == max_retries - 1:
+                raise Exception(f"SL/TP batch failed for {symbol}: {failed[0][1]}")
+
+            await asyncio.sleep(1)
+            # Slightly adjust prices on the failed orders before retry
+            adjustment_factor = 1.001 if side == "BUY" else 0.999
+            retry = []
+            for order, _ in failed:
+                order = dict(order)
+                order['stopPrice'] = str(round(
+                    float(order['stopPrice']) * adjustment_factor, price_precision
+                ))
+                retry.append(order)
+            pending = retry
 
     async def _place_validated_orders(self, symbol, side, quantity, sl_price, take_profits, price_precision):
         """Place orders with validated parameters"""
-        # Place Stop Loss
-        await self.client.create_order(
-            symbol=symbol,
-            side="SELL" if side == "BUY" else "BUY",
-            quantity=round(quantity, price_precision),
-            order_type="STOP_MARKET",
-            stopPrice=str(sl_price),
-            reduceOnly="true"
-        )
-        
-        # Place Take Profits
-        for tp in take_profits:
-            await self.client.create_order(
+        opp_side = "SELL" if side == "BUY" else "BUY"
+        await asyncio.gather(
+            # Stop Loss
+            self.client.create_order(
                 symbol=symbol,
-                side="SELL" if side == "BUY" else "BUY",
-                quantity=round(quantity * (tp['percentage'] / 100), price_precision),
-                order_type="TAKE_PROFIT_MARKET",
-                stopPrice=str(tp['price']),
+                side=opp_side,
+                quantity=round(quantity, price_precision),
+                order_type="STOP_MARKET",
+                stopPrice=str(sl_price),
                 reduceOnly="true"
-            )
+            ),
+            # Take Profits
+            *[
+                self.client.create_order(
+                    symbol=symbol,
+                    side=opp_side,
+                    quantity=round(quantity * (tp['percentage'] / 100), price_precision),
+                    order_type="TAKE_PROFIT_MARKET",
+                    stopPrice=str(tp['price']),
+                    reduceOnly="true"
+                )
+                for tp in take_profits
+            ]
+        )
 
     async def _place_sl_order(self, symbol, side, quantity, stop_price):
         """Place stop loss order with retries"""
@@ -443,18 +417,17 @@ class OrderManager:
                 return None
                 
             # Get current price
-            klines = await self.client.get_klines(symbol, limit=1)
-            current_price = float(klines['close'].iloc[-1])
-            
+            current_price = await self.client.get_last_close(symbol)
+
             # Calculate PnL
             pnl = self._calculate_pnl(position, current_price)
             
             # Close position
-            side = "SELL" if position['side'] == "BUY" else "BUY"
+            side = "SELL" if position.side == "BUY" else "BUY"
             result = await self.client.create_order(
                 symbol=symbol,
                 side=side,
-                quantity=position['quantity'],
+                quantity=position.quantity,
                 order_type="MARKET"
             )
             
@@ -487,12 +460,20 @@ class OrderManager:
             return result
             
         except Exception as e:
-            self.logger.error(f"Error closing position: {str(e)}")
-            await self.notifier.send_alert(
+            self.logger.error("Error closing position: %s", e)
+            # Fire-and-forget: don't stall the caller on Telegram's RTT
+            # (or an outage) just to report the failure
+            asyncio.create_task(self._safe_alert(
                 f"❌ Failed to close {symbol}\nError: {str(e)}",
                 "error"
-            )
+            ))
             return None
+
+    async def _safe_alert(self, message, level):
+        try:
+            await self.notifier.send_alert(message, level)
+        except Exception as e:
+            self.logger.error("Alert delivery failed: %s", e)
         
     async def _cancel_all_orders(self, symbol):
         """Cancel all open orders for a symbol"""
@@ -509,65 +490,88 @@ class OrderManager:
         
     async def check_positions(self):
         positions = self.order_manager.position_tracker.get_all_positions()
-        for position in positions:
-            symbol = position['symbol']
-            try:
-                # Update trailing stops
-                await self.order_manager.order_management.update_trailing_stop(symbol, position)
-                
-                # Check if position was closed by exchange
-                exchange_positions = await self.client.get_position_risk()
-                pos_info = next((p for p in exchange_positions if p['symbol'] == symbol), None)
-                
-                if pos_info and float(pos_info['positionAmt']) == 0:
-                    # Position was closed externally
-                    await self.order_manager.order_management.cleanup_orders(symbol)
-                    self.order_manager.position_tracker.close_position(
-                        symbol,
-                        exit_price=float(pos_info['entryPrice']),
-                        exit_reason='external_close'
-                    )
-                    
-            except Exception as e:
-                self.logger.error(f"Position check error for {symbol}: {str(e)}")
+        if not positions:
+            return
+
+        # One exchange snapshot for the whole sweep (the old loop re-fetched
+        # every position per symbol), then run the per-position checks
+        # concurrently
+        exchange_positions = await self.client.get_position_risk()
+        pos_by_sym = {p['symbol']: p for p in exchange_positions}
+
+        await asyncio.gather(*[
+            self._check_one_position(position, pos_by_sym.get(position.symbol))
+            for position in positions
+        ])
+
+    async def _check_one_position(self, position, pos_info):
+        symbol = position.symbol
+        try:
+            # Update trailing stops
+            await self.order_manager.order_management.update_trailing_stop(symbol, position)
+
+            if pos_info and float(pos_info['positionAmt']) == 0:
+                # Position was closed externally
+                await self.order_manager.order_management.cleanup_orders(symbol)
+                self.order_manager.position_tracker.close_position(
+                    symbol,
+                    exit_price=float(pos_info['entryPrice']),
+                    exit_reason='external_close'
+                )
+
+        except Exception as e:
+            self.logger.error(f"Position check error for {symbol}: {str(e)}")
         
     async def cancel_all_active_orders(self):
         """Cancel all active orders for all symbols"""
-        for symbol in list(self.active_orders.keys()):
-            try:
-                await self.client._request(
-                    "DELETE", 
-                    "/fapi/v1/allOpenOrders",
-                    {'symbol': symbol},
-                    signed=True
-                )
-                del self.active_orders[symbol]
-            except Exception as e:
-                self.logger.error(f"Error cancelling orders for {symbol}: {e}")
+        symbols = list(self.active_orders.keys())
+        if not symbols:
+            return
+
+        # One gathered sweep instead of a serial round-trip per symbol
+        results = await asyncio.gather(*[
+            self.client._request(
+                "DELETE",
+                "/fapi/v1/allOpenOrders",
+                {'symbol': symbol},
+                signed=True
+            )
+            for symbol in symbols
+        ], return_exceptions=True)
+
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                self.logger.error("Error cancelling orders for %s: %s", symbol, result)
+            else:
+                self.active_orders.pop(symbol, None)
+
+    async def _get_precision(self, symbol):
+        """Symbol precision essentially never changes - resolve it once"""
+        precision = self._precision_cache.get(symbol)
+        if precision is None:
+            precision = await self.client.get_precision(symbol)
+            self._precision_cache[symbol] = precision
+        return precision
 
     def _calculate_pnl(self, position, exit_price):
-        if position['side'] == "BUY":
-            return (exit_price - position['entry_price']) * position['quantity']
-        else:
-            return (position['entry_price'] - exit_price) * position['quantity']
+        return position.sign * (exit_price - position.entry_price) * position.quantity
 
     async def apply_trailing_stop(self, symbol, activation_percent, trail_percent):
         position = self.position_tracker.get_position(symbol)
         if not position:
             return
             
-        klines = await self.client.get_klines(symbol, limit=1)
-        current_price = float(klines['close'].iloc[-1])
-        
-        if position['side'] == "BUY":
-            profit_pct = (current_price - position['entry_price']) / position['entry_price']
+        current_price = await self.client.get_last_close(symbol)
+
+        if position.side == "BUY":
+            profit_pct = (current_price - position.entry_price) / position.entry_price
             if profit_pct >= activation_percent:
                 new_stop = current_price * (1 - trail_percent)
-                if new_stop > position['stop_loss']:
-                    position['stop_loss'] = new_stop
+                if new_stop > position.stop_loss:
+                    position.stop_loss = new_stop
         else:
-            profit_pct = (position['entry_price'] - current_price) / position['entry_price']
+            profit_pct = (position.entry_price - current_price) / position.entry_price
             if profit_pct >= activation_percent:
                 new_stop = current_price * (1 + trail_percent)
-                if new_stop < position['stop_loss']:
-                    position['stop_loss'] = new_stop
\ No newline at end of file
+                if new_stop < position.stop_loss:
+                    position.stop_loss = new_stop
\ No newline at end of file
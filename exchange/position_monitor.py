@@ -1,4 +1,5 @@
 import asyncio
+import numpy as np
 from datetime import datetime
 
 class PositionMonitor:
@@ -16,29 +17,63 @@ class PositionMonitor:
                 await self.check_positions()
                 await asyncio.sleep(5)  # Check every 5 seconds
             except Exception as e:
-                self.logger.error(f"Position monitor error: {e}")
+                self.logger.error("Position monitor error: %s", e)
                 await asyncio.sleep(10)
 
     async def check_positions(self):
         positions = self.order_manager.position_tracker.get_all_positions()
-        for position in positions:
-            symbol = position['symbol']
+        if not positions:
+            return
+
+        # Prefer prices pushed by the mark-price stream; one all-symbols
+        # REST call covers anything the stream hasn't ticked yet. The old
+        # code paid a klines round-trip per position per 5s tick.
+        price_map = {
+            p.symbol: self.client.get_cached_price(p.symbol)
+            for p in positions
+        }
+        if any(price is None for price in price_map.values()):
+            tickers = await self.client.get_all_mark_prices()
+            rest_prices = {t['symbol']: float(t['price']) for t in tickers}
+            for symbol, price in price_map.items():
+                if price is None:
+                    price_map[symbol] = rest_prices.get(symbol)
+
+        # Struct-of-arrays layout: one vectorized comparison across every
+        # position instead of branchy per-position Python checks. Missing
+        # prices/stops become NaN, which compares False and is skipped.
+        prices = np.array([
+            price_map.get(p.symbol) if price_map.get(p.symbol) is not None else np.nan
+            for p in positions
+        ])
+        is_long = np.array([p.side == 'BUY' for p in positions])
+        stops = np.array([
+            p.stop_loss if p.stop_loss is not None else np.nan
+            for p in positions
+        ])
+
+        max_tps = max((len(p.take_profits) for p in positions), default=0)
+        tp_grid = np.full((len(positions), max(max_tps, 1)), np.nan)
+        for i, p in enumerate(positions):
+            for j, tp in enumerate(p.take_profits):
+                tp_grid[i, j] = tp['price']
+
+        with np.errstate(invalid='ignore'):
+            sl_hit = np.where(is_long, prices <= stops, prices >= stops)
+            tp_hit = np.where(
+                is_long[:, None],
+                prices[:, None] >= tp_grid,
+                prices[:, None] <= tp_grid
+            ).any(axis=1)
+
+        for i, position in enumerate(positions):
+            symbol = position.symbol
             try:
-                klines = await self.client.get_klines(symbol, limit=1)
-                current_price = float(klines['close'].iloc[-1])
-                
-                # Check stop loss
-                if ((position['side'] == 'BUY' and current_price <= position['stop_loss']) or 
-                    (position['side'] == 'SELL' and current_price >= position['stop_loss'])):
-                    await self.order_manager.close_position(symbol, "stop_loss")
+                if not np.isfinite(prices[i]):
                     continue
-                    
-                # Check take profits
-                for tp in position['take_profits']:
-                    if ((position['side'] == 'BUY' and current_price >= tp['price']) or 
-                        (position['side'] == 'SELL' and current_price <= tp['price'])):
-                        await self.order_manager.close_position(symbol, "take_profit")
-                        break
-                        
+                if sl_hit[i]:
+                    await self.order_manager.close_position(symbol, "stop_loss")
+                elif tp_hit[i]:
+                    await self.order_manager.close_position(symbol, "take_profit")
             except Exception as e:
-                self.logger.error(f"Error monitoring {symbol}: {e}")
\ No newline at end of file
+                self.logger.error("Error monitoring %s: %s", symbol, e)
\ No newline at end of file
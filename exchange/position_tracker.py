@@ -1,4 +1,46 @@
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class Position:
+    """Tracked position with fixed slot layout.
+
+    Slots keep per-position memory flat and make field access cheaper
+    than the stringly-keyed dicts these used to be.
+    """
+    symbol: str
+    side: str
+    quantity: float
+    entry_price: float
+    # Raw time.time_ns() stamps - a vDSO call and a native int instead of
+    # a datetime object per event; render via entry_datetime() when needed
+    entry_time_ns: int = 0
+    stop_loss: Optional[float] = None
+    take_profits: List = field(default_factory=list)
+    leverage: int = 1
+    exit_price: Optional[float] = None
+    exit_time_ns: Optional[int] = None
+    exit_reason: Optional[str] = None
+    pnl: float = 0.0
+    # +1.0 for longs, -1.0 for shorts - resolved once at open so PnL math
+    # is a branchless multiply instead of a string compare per call
+    sign: float = 0.0
+
+    def __post_init__(self):
+        if not self.sign:
+            self.sign = 1.0 if self.side == 'BUY' else -1.0
+
+    def entry_datetime(self):
+        return datetime.utcfromtimestamp(self.entry_time_ns / 1e9)
+
+    def exit_datetime(self):
+        if self.exit_time_ns is None:
+            return None
+        return datetime.utcfromtimestamp(self.exit_time_ns / 1e9)
+
 
 class PositionTracker:
     def __init__(self, config, logger):
@@ -6,15 +48,20 @@ class PositionTracker:
         self.logger = logger
         self.positions = {}
         self.closed_positions = []
+        # Running total so get_total_pnl never re-sums the whole history
+        self._total_pnl = 0.0
         
     async def sync_with_exchange(self, client):
         """Sync local positions with exchange"""
         try:
             exchange_positions = await client.get_position_risk()
-            
+            # One pass over the exchange payload instead of an O(n) scan
+            # per tracked symbol
+            pos_by_sym = {p['symbol']: p for p in exchange_positions}
+
             # Remove positions that no longer exist
             for symbol in list(self.positions.keys()):
-                pos = next((p for p in exchange_positions if p['symbol'] == symbol), None)
+                pos = pos_by_sym.get(symbol)
                 if not pos or float(pos['positionAmt']) == 0:
                     self.close_position(
                         symbol,
@@ -25,29 +72,35 @@ class PositionTracker:
                     
             # Add new positions from exchange
             for pos in exchange_positions:
-                if float(pos['positionAmt']) != 0 and pos['symbol'] not in self.positions:
+                amt = float(pos['positionAmt'])
+                if amt != 0 and pos['symbol'] not in self.positions:
                     self.add_position({
                         'symbol': pos['symbol'],
-                        'side': 'BUY' if float(pos['positionAmt']) > 0 else 'SELL',
-                        'quantity': abs(float(pos['positionAmt'])),
+                        'side': 'BUY' if amt > 0 else 'SELL',
+                        'quantity': abs(amt),
                         'entry_price': float(pos['entryPrice']),
                         'leverage': int(pos['leverage']),
-                        'entry_time': datetime.utcnow(),
+                        'entry_time_ns': time.time_ns(),
                         'stop_loss': None,  # Will be updated
                         'take_profits': []  # Will be updated
                     })
         except Exception as e:
-            self.logger.error(f"Error syncing positions: {str(e)}")
+            self.logger.error("Error syncing positions: %s", e)
             raise
         
     def add_position(self, position):
-        symbol = position['symbol']
+        if isinstance(position, dict):
+            position = Position(**position)
+
+        symbol = position.symbol
         if symbol in self.positions:
-            self.logger.warning(f"Position for {symbol} already exists")
+            self.logger.warning("Position for %s already exists", symbol)
             return
-            
+
         self.positions[symbol] = position
-        self.logger.info(f"New position added: {symbol} - Qty: {position['quantity']}")
+        # Lazy %-formatting: the record is only rendered if a handler
+        # actually emits it
+        self.logger.info("New position added: %s - Qty: %s", symbol, position.quantity)
         
     def get_position(self, symbol):
         return self.positions.get(symbol)
@@ -57,17 +110,16 @@ class PositionTracker:
             return
             
         position = self.positions[symbol]
-        position.update({
-            'exit_price': exit_price,
-            'exit_time': datetime.utcnow(),
-            'exit_reason': exit_reason,
-            'pnl': pnl
-        })
-        
+        position.exit_price = exit_price
+        position.exit_time_ns = time.time_ns()
+        position.exit_reason = exit_reason
+        position.pnl = pnl
+
         self.closed_positions.append(position)
         del self.positions[symbol]
+        self._total_pnl += pnl
         
-        self.logger.info(f"Position closed: {symbol} PnL: {pnl:.2f}")
+        self.logger.info("Position closed: %s PnL: %.2f", symbol, pnl)
         
     def get_all_positions(self):
         return list(self.positions.values())
@@ -76,4 +128,4 @@ class PositionTracker:
         return self.closed_positions
         
     def get_total_pnl(self):
-        return sum(p['pnl'] for p in self.closed_positions)
\ No newline at end of file
+        return self._total_pnl
\ No newline at end of file
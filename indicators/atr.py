@@ -1,14 +1,51 @@
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _atr_kernel(high, low, close, period, out):
+    """True range + rolling mean in one native pass.
+
+    Replaces the pandas concat/max/rolling chain, which allocated three
+    intermediate Series per call.
+    """
+    n = high.shape[0]
+    tr = np.empty(n)
+    tr[0] = high[0] - low[0]
+    for i in range(1, n):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        tr[i] = max(hl, hc, lc)
+
+    s = 0.0
+    for i in range(n):
+        s += tr[i]
+        if i >= period:
+            s -= tr[i - period]
+        if i >= period - 1:
+            out[i] = s / period
+        else:
+            out[i] = np.nan
+
+
+if njit is not None:
+    _atr_kernel = njit(cache=True, fastmath=True)(_atr_kernel)
+
+
 def calculate_atr(df, period=14):
     """
     Calculate Average True Range (ATR)
     """
-    high_low = df['high'] - df['low']
-    high_close = abs(df['high'] - df['close'].shift())
-    low_close = abs(df['low'] - df['close'].shift())
-    
-    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    atr = true_range.rolling(window=period).mean()
-    
-    return atr
\ No newline at end of file
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    close = df['close'].to_numpy(dtype=np.float64)
+
+    out = np.empty(len(high))
+    _atr_kernel(high, low, close, period, out)
+
+    return pd.Series(out, index=df.index)
@@ -5,7 +5,21 @@ def calculate_obv(df, period=14):
     """
     Calculate On-Balance Volume (OBV)
     """
-    obv = (np.sign(df['close'].diff()) * df['volume']).fillna(0).cumsum()
-    obv_sma = obv.rolling(window=period).mean()
-    
-    return obv, obv_sma
\ No newline at end of file
+    close = df['close'].to_numpy(dtype=np.float64)
+    volume = df['volume'].to_numpy(dtype=np.float64)
+
+    # Fused NumPy pass instead of the diff/sign/fillna/cumsum Series chain
+    delta = np.empty_like(close)
+    delta[0] = 0.0
+    np.subtract(close[1:], close[:-1], out=delta[1:])
+    obv = np.cumsum(np.sign(delta) * volume)
+
+    # Rolling mean as a prefix-sum difference; the leading window stays
+    # NaN to match pandas rolling().mean() output
+    obv_sma = np.full_like(obv, np.nan)
+    if obv.shape[0] >= period:
+        csum = np.cumsum(obv)
+        obv_sma[period - 1] = csum[period - 1] / period
+        obv_sma[period:] = (csum[period:] - csum[:-period]) / period
+
+    return pd.Series(obv, index=df.index), pd.Series(obv_sma, index=df.index)
@@ -1,15 +1,58 @@
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _rsi_kernel(close, period, out):
+    """Rolling-mean RSI with running gain/loss sums.
+
+    Same add-new/subtract-old window as the other jitted indicators;
+    matches the old pandas where/rolling output including the NaN
+    warm-up and the loss==0 edge cases.
+    """
+    n = close.shape[0]
+    gains = np.zeros(n)
+    losses = np.zeros(n)
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        if d > 0:
+            gains[i] = d
+        elif d < 0:
+            losses[i] = -d
+
+    gain_s = 0.0
+    loss_s = 0.0
+    for i in range(n):
+        gain_s += gains[i]
+        loss_s += losses[i]
+        if i >= period:
+            gain_s -= gains[i - period]
+            loss_s -= losses[i - period]
+        if i < period - 1:
+            out[i] = np.nan
+        elif loss_s == 0.0:
+            # rs is inf (all gains) -> 100, or 0/0 (flat window) -> NaN
+            out[i] = 100.0 if gain_s > 0.0 else np.nan
+        else:
+            rs = gain_s / loss_s
+            out[i] = 100.0 - 100.0 / (1.0 + rs)
+
+
+if njit is not None:
+    _rsi_kernel = njit(cache=True, fastmath=True)(_rsi_kernel)
+
+
 def calculate_rsi(df, period=14):
     """
     Calculate Relative Strength Index (RSI)
     """
-    delta = df['close'].diff()
-    
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    
-    return rsi
\ No newline at end of file
+    close = df['close'].to_numpy(dtype=np.float64)
+
+    out = np.empty(len(close))
+    _rsi_kernel(close, period, out)
+
+    return pd.Series(out, index=df.index)
@@ -24,6 +24,7 @@ class FutBotV2:
         self.risk_manager = None
         self.liquidation_monitor = None
         self.performance_tracker = None
+        self.position_tracker = None
         self.running = False
 
     async def initialize(self):
@@ -95,8 +96,7 @@ class FutBotV2:
         for symbol in symbols:
             try:
                 # Skip if we already have a position
-                if (hasattr(self, 'position_tracker') and 
-                    self.position_tracker.get_position(symbol)):
+                if self.position_tracker and self.position_tracker.get_position(symbol):
                     continue
 
                 # Get market signal first
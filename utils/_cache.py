@@ -0,0 +1,38 @@
+import hashlib
+import pickle
+from pathlib import Path
+
+# On-disk memoization for expensive, deterministic computations such as
+# backtest runs. Entries are pickled under .cache/<sha256>.pkl in the
+# project root; delete the directory to invalidate everything.
+_CACHE_DIR = Path(__file__).parent.parent / '.cache'
+
+
+def cache_key(*parts) -> str:
+    """Stable hash over the string forms of the key parts"""
+    payload = '|'.join(str(p) for p in parts)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def cache_get(key: str):
+    """Cached value for key, or None on a miss or unreadable entry"""
+    path = _CACHE_DIR / f"{key}.pkl"
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def cache_put(key: str, value) -> None:
+    """Persist value under key; failures are swallowed, caching is best-effort"""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = _CACHE_DIR / f"{key}.pkl.tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(_CACHE_DIR / f"{key}.pkl")
+    except Exception:
+        pass
@@ -1,16 +1,18 @@
 import os
+import re
+import logging
+import orjson
 from dotenv import load_dotenv
-import json
+from functools import lru_cache
 from pathlib import Path
 
-import os
-from dotenv import load_dotenv
-import json
-from pathlib import Path
+logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
 def load_config():
     # Load .env from root directory
-    env_path = Path(__file__).parent.parent / '.env'
+    root_dir = Path(__file__).parent.parent
+    env_path = root_dir / '.env'
     if not env_path.exists():
         raise FileNotFoundError(f".env file not found at {env_path}")
     
@@ -37,24 +39,24 @@ def load_config():
     }
 
     # Debug output - show we have the values
-    print("\nConfiguration Verification:")
-    print(f"Binance API Key: {'*' * 20}{config['binance']['api_key'][-5:]}")
-    print(f"Binance API Secret: {'*' * 20}{config['binance']['api_secret'][-5:]}")
-    print(f"Telegram Token: {'*' * 20}{config['telegram']['bot_token'][-5:]}")
-    print(f"Telegram Chat ID: {config['telegram']['chat_id']}")
+    logger.debug("Configuration Verification:")
+    logger.debug("Binance API Key: %s%s", '*' * 20, config['binance']['api_key'][-5:])
+    logger.debug("Binance API Secret: %s%s", '*' * 20, config['binance']['api_secret'][-5:])
+    logger.debug("Telegram Token: %s%s", '*' * 20, config['telegram']['bot_token'][-5:])
+    logger.debug("Telegram Chat ID: %s", config['telegram']['chat_id'])
 
     # Load additional config files
-    config_dir = Path(__file__).parent.parent / 'config'
+    config_dir = root_dir / 'config'
     try:
         # Load pairs.json
-        with open(config_dir / 'pairs.json') as f:
-            pairs_config = json.load(f)
+        with open(config_dir / 'pairs.json', 'rb') as f:
+            pairs_config = orjson.loads(f.read())
             config['pairs'] = pairs_config
-        
+
         # Load main config.json
-        with open(config_dir / 'config.json') as f:
-            main_config = json.load(f)
-            
+        with open(config_dir / 'config.json', 'rb') as f:
+            main_config = orjson.loads(f.read())
+
             # Merge strategy config
             if 'strategy' in main_config:
                 config['strategy'] = main_config['strategy']
@@ -68,21 +70,24 @@ def load_config():
                 config['risk'] = main_config['risk']
                 
     except Exception as e:
-        print(f"Warning: Could not load config files: {e}")
+        logger.warning("Could not load config files: %s", e)
 
     # Final verification
-    print("\nFinal Verified Values:")
-    print(f"Telegram Token Length: {len(config['telegram']['bot_token'])}")
-    print(f"Chat ID Length: {len(config['telegram']['chat_id'])}")
-    
+    logger.debug("Telegram Token Length: %d", len(config['telegram']['bot_token']))
+    logger.debug("Chat ID Length: %d", len(config['telegram']['chat_id']))
+
     return config
 
+# Compiled once - sanitizing a key is then a single C call instead of a
+# per-character isalnum() loop
+_NON_ALNUM = re.compile(r'[^0-9A-Za-z]')
+
 def validate_binance_key(key):
     """More lenient validation for Binance API keys"""
     if not key or len(key) < 30:  # Reduced minimum length requirement
         raise ValueError("Invalid Binance API key - too short or empty")
-    
+
     # Remove any non-alphanumeric characters before checking
-    clean_key = ''.join(c for c in key if c.isalnum())
+    clean_key = _NON_ALNUM.sub('', key)
     if len(clean_key) < 30:
         raise ValueError("Invalid Binance API key - contains too many special characters")
\ No newline at end of file
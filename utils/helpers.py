@@ -1,16 +1,25 @@
 import time
 import hashlib
 import hmac
+from functools import lru_cache
 from typing import Dict, Any
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
+@lru_cache(maxsize=8)
+def _hmac_template(secret: bytes) -> hmac.HMAC:
+    """Pre-keyed HMAC context, built once per secret"""
+    return hmac.new(secret, b'', hashlib.sha256)
+
 def generate_signature(secret: str, data: str) -> str:
     """Generate HMAC SHA256 signature"""
-    return hmac.new(
-        secret.encode('utf-8'),
-        data.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    # Copying the cached context skips the per-call key schedule; only
+    # the payload block is hashed per request
+    ctx = _hmac_template(secret.encode('utf-8')).copy()
+    ctx.update(data.encode('utf-8'))
+    return ctx.hexdigest()
 
 def timestamp() -> int:
     """Get current timestamp in milliseconds"""
@@ -20,6 +29,20 @@ def format_timestamp(ts: int) -> str:
     """Format timestamp to human-readable string"""
     return datetime.fromtimestamp(ts/1000).strftime('%Y-%m-%d %H:%M:%S')
 
+def format_timestamps(ts) -> np.ndarray:
+    """Vectorized format_timestamp for a whole array of timestamps.
+
+    Accepts millisecond integers or datetime64 values; one C-level pass
+    beats calling format_timestamp per element when formatting thousands
+    of trades for a report.
+    """
+    arr = np.asarray(ts)
+    if arr.dtype.kind in 'iuf':
+        index = pd.to_datetime(arr, unit='ms')
+    else:
+        index = pd.to_datetime(arr)
+    return index.strftime('%Y-%m-%d %H:%M:%S').values
+
 def calculate_pnl(entry_price: float, exit_price: float, quantity: float, is_long: bool) -> float:
     """Calculate profit/loss for a trade"""
     if is_long:
@@ -7,32 +7,39 @@ from colorama import Fore, Style, init
 init()  # Initialize colorama
 
 class ColoredFormatter(logging.Formatter):
+    # Keyed by the int levelno rather than the levelname string - int
+    # hashing is cheaper and skips the levelname attribute resolution on
+    # every record
     COLORS = {
-        'DEBUG': Fore.CYAN,
-        'INFO': Fore.GREEN,
-        'WARNING': Fore.YELLOW,
-        'ERROR': Fore.RED,
-        'CRITICAL': Fore.RED + Style.BRIGHT
+        logging.DEBUG: Fore.CYAN,
+        logging.INFO: Fore.GREEN,
+        logging.WARNING: Fore.YELLOW,
+        logging.ERROR: Fore.RED,
+        logging.CRITICAL: Fore.RED + Style.BRIGHT
     }
+    _RESET = Style.RESET_ALL
 
     def format(self, record):
-        color = self.COLORS.get(record.levelname, Fore.WHITE)
-        message = super().format(record)
-        return f"{color}{message}{Style.RESET_ALL}"
+        color = self.COLORS.get(record.levelno, Fore.WHITE)
+        return color + super().format(record) + self._RESET
+
+# Loggers that already have their handlers installed - repeat calls
+# return them untouched instead of reopening the log file
+_configured = set()
 
 def configure_logger(name: str = 'futbot') -> logging.Logger:
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)  # Set to DEBUG to capture all messages
+    if name in _configured:
+        return logger
 
-    # Clear existing handlers
-    logger.handlers = []
+    logger.setLevel(logging.DEBUG)  # Set to DEBUG to capture all messages
 
     # Create logs directory if it doesn't exist
     log_dir = Path(__file__).parent.parent / 'logs'
     log_dir.mkdir(exist_ok=True)
-    
-    # File handler
-    file_handler = logging.FileHandler(log_dir / 'futbot.log')
+
+    # File handler - delay defers the FD until the first record
+    file_handler = logging.FileHandler(log_dir / 'futbot.log', delay=True)
     file_handler.setLevel(logging.DEBUG)
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -50,4 +57,5 @@ def configure_logger(name: str = 'futbot') -> logging.Logger:
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
 
+    _configured.add(name)
     return logger
\ No newline at end of file
@@ -1,4 +1,6 @@
-from datetime import datetime
+import array
+import time
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import numpy as np
 
@@ -8,13 +10,24 @@ class PerformanceTracker:
         self.current_balance = initial_balance
         self.trades: List[Dict] = []
         self.open_positions: Dict[str, Dict] = {}
+        today = datetime.now().date()
         self.daily_stats = {
-            'date': datetime.now().date(),
+            'date': today,
             'trades': 0,
             'wins': 0,
             'losses': 0,
             'pnl': 0.0
         }
+        # Epoch of the next midnight: the rollover check is then a single
+        # time.time() comparison instead of datetime.now().date() per trade
+        self._day_rollover = self._next_midnight_epoch(today)
+        # Closed-trade PnLs as a compact typed array, appended on close -
+        # get_stats reads it as numpy instead of re-filtering the dicts
+        self._pnls = array.array('d')
+
+    @staticmethod
+    def _next_midnight_epoch(day) -> float:
+        return datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
 
     def add_trade(self, trade: Dict) -> None:
         """Record a new trade"""
@@ -43,15 +56,16 @@ class PerformanceTracker:
         trade['pnl'] = pnl
         trade['pnl_pct'] = (pnl / self.initial_balance) * 100
         self.current_balance += pnl
-        
+        self._pnls.append(pnl)
+
         # Update daily stats
         self._update_daily_stats(pnl > 0)
         
         return trade
 
     def _update_daily_stats(self, is_win: bool) -> None:
-        today = datetime.now().date()
-        if today != self.daily_stats['date']:
+        if time.time() >= self._day_rollover:
+            today = datetime.now().date()
             self.daily_stats = {
                 'date': today,
                 'trades': 0,
@@ -59,7 +73,9 @@ class PerformanceTracker:
                 'losses': 0,
                 'pnl': 0.0
             }
-            
+            self._day_rollover = self._next_midnight_epoch(today)
+
+
         self.daily_stats['trades'] += 1
         if is_win:
             self.daily_stats['wins'] += 1
@@ -68,20 +84,22 @@ class PerformanceTracker:
 
     def get_stats(self) -> Dict:
         """Return performance statistics"""
-        closed_trades = [t for t in self.trades if 'exit_price' in t]
-        
+        # Zero-copy numpy view over the running PnL array - no dict
+        # filtering per poll
+        pnls = np.frombuffer(self._pnls, dtype=np.float64)
+
         stats = {
             'initial_balance': self.initial_balance,
             'current_balance': self.current_balance,
             'total_pnl': self.current_balance - self.initial_balance,
             'total_pnl_pct': ((self.current_balance - self.initial_balance) / self.initial_balance) * 100,
             'total_trades': len(self.trades),
-            'closed_trades': len(closed_trades),
+            'closed_trades': len(pnls),
             'open_trades': len(self.open_positions),
-            'win_rate': (len([t for t in closed_trades if t['pnl'] > 0]) / len(closed_trades)) * 100 if closed_trades else 0,
+            'win_rate': float((pnls > 0).mean() * 100) if len(pnls) else 0,
             'daily_stats': self.daily_stats
         }
-        
+
         return stats
 
     def get_open_position(self, symbol: str) -> Optional[Dict]: